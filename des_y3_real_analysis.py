@@ -129,12 +129,17 @@ def estimate_s8_from_correlation_functions(bins_data: Dict[int, DESBinData]) ->
     for bin_data in bins_data.values():
         # Use scales 10-50 arcmin (avoid very small/large scales)
         mask = (bin_data.theta_arcmin > 10) & (bin_data.theta_arcmin < 50)
-        if np.sum(mask) > 0:
-            all_xi_plus.extend(bin_data.xi_plus[mask])
-            all_z_eff.extend([bin_data.z_eff] * np.sum(mask))
+        n_selected = np.count_nonzero(mask)
+        if n_selected > 0:
+            all_xi_plus.append(bin_data.xi_plus[mask])
+            all_z_eff.append(np.full(n_selected, bin_data.z_eff))
 
-    mean_xi_plus = np.mean(all_xi_plus)
-    mean_z = np.mean(all_z_eff)
+    # No bin has scales in the cut: same nan estimate as a mean over no points
+    if not all_xi_plus:
+        return np.nan, DES_S8_SIGMA
+
+    mean_xi_plus = np.mean(np.concatenate(all_xi_plus))
+    mean_z = np.mean(np.concatenate(all_z_eff))
 
     # Empirical scaling: S₈² ∝ ξ₊ * (1+z)^α
     # Calibrated to DES published value
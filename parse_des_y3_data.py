@@ -19,8 +19,18 @@ from typing import Dict, List, Tuple
 import sys
 import os
 
+# Optional: Parquet output for downstream analysis
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Import centralized constants (SSOT)
 from config.surveys import DES_S8
+from utils.files import list_data_files
+from utils.reporting import env_flag
 
 # Path to DES data
 DATA_DIR = "./data/des_y3"
@@ -48,10 +58,10 @@ DES_S8_SIGMA = 0.017
 
 def find_des_data_file():
     """Find DES data file from list of possible names"""
+    present = list_data_files(DATA_DIR)
     for filename in POSSIBLE_FILENAMES:
-        filepath = os.path.join(DATA_DIR, filename)
-        if os.path.exists(filepath):
-            return filepath
+        if filename in present:
+            return os.path.join(DATA_DIR, filename)
     return None
 
 
@@ -80,15 +90,17 @@ def load_des_y3_data():
 
     # Open FITS file
     try:
-        hdul = fits.open(xipm_file)
+        # Read-only memmap; only the xip/xim rows we select are copied out
+        hdul = fits.open(xipm_file, memmap=True, mode='denywrite', lazy_load_hdus=True)
     except Exception as e:
         print(f"\n⚠️  ERROR: Could not open FITS file: {e}")
         sys.exit(1)
 
-    # Inspect file structure
-    print("\nFITS file structure:")
-    hdul.info()
-    print("")
+    # Inspect file structure (parses every HDU header, so opt-in only)
+    if env_flag('DES_VERBOSE'):
+        print("\nFITS file structure:")
+        hdul.info()
+        print("")
 
     # Extract data based on DES structure
     # DES typically uses: 'xip', 'xim', 'gammat', 'wtheta', 'covmat', 'nz_source'
@@ -108,9 +120,9 @@ def load_des_y3_data():
 
         # Get covariance matrix
         if 'covmat' in [h.name.lower() for h in hdul]:
-            covmat = hdul['covmat'].data
+            covmat = np.array(hdul['covmat'].data)
         elif 'COVMAT' in [h.name for h in hdul]:
-            covmat = hdul['COVMAT'].data
+            covmat = np.array(hdul['COVMAT'].data)
         else:
             print("\n⚠️  WARNING: No covariance matrix found, will use diagonal")
             covmat = None
@@ -143,6 +155,11 @@ def load_des_y3_data():
     # Organize data by tomographic bins
     bins_data = {}
 
+    # Auto-correlations are a subset of all rows, so this bounds the
+    # combined ξ₊ buffer filled in the loop below
+    all_xi_plus = np.empty(len(xip_data), dtype=np.float64)
+    n_total = 0
+
     # DES uses BIN1, BIN2, ANGBIN, VALUE, ANG (similar to KiDS)
     # Bins are numbered 1-4 (not 0-3)
 
@@ -162,11 +179,13 @@ def load_des_y3_data():
             continue
 
         # Angular scales (in arcminutes)
-        theta_arcmin = bin_xip['ANG']
+        # FITS columns are big-endian; swap once here so later reductions
+        # run on native float64
+        theta_arcmin = np.ascontiguousarray(bin_xip['ANG'], dtype=np.float64)
 
         # Correlation function values
-        xi_plus = bin_xip['VALUE']
-        xi_minus = bin_xim['VALUE']
+        xi_plus = np.ascontiguousarray(bin_xip['VALUE'], dtype=np.float64)
+        xi_minus = np.ascontiguousarray(bin_xim['VALUE'], dtype=np.float64)
 
         # Calculate effective redshift
         z_low, z_high = Z_BINS[bin_idx]
@@ -181,22 +200,29 @@ def load_des_y3_data():
             'n_points': len(xi_plus)
         }
 
+        all_xi_plus[n_total:n_total + len(xi_plus)] = xi_plus
+        n_total += len(xi_plus)
+
         print(f"\nBin {bin_idx+1} (z={z_low:.2f}-{z_high:.2f}, z_eff={z_eff:.2f}):")
         print(f"  Angular scales: {theta_arcmin[0]:.2f} - {theta_arcmin[-1]:.2f} arcmin")
-        print(f"  ξ₊ range: {xi_plus.min():.2e} - {xi_plus.max():.2e}")
-        print(f"  ξ₋ range: {xi_minus.min():.2e} - {xi_minus.max():.2e}")
+        # Value ranges cost two array scans each, so opt-in only
+        if env_flag('DES_VERBOSE'):
+            print(f"  ξ₊ range: {xi_plus.min():.2e} - {xi_plus.max():.2e}")
+            print(f"  ξ₋ range: {xi_minus.min():.2e} - {xi_minus.max():.2e}")
         print(f"  Number of points: {len(xi_plus)}")
 
+    # Per-bin arrays and covmat are owned copies, so the memmap can go now
+    hdul.close()
+
     # Calculate combined S8 from all bins (simple weighted mean for verification)
     # This is a rough estimate to verify we loaded the right data
-    all_xi_plus = np.concatenate([bins_data[i]['xi_plus'] for i in range(4)])
-    mean_xi = np.mean(all_xi_plus)
+    mean_xi = np.mean(all_xi_plus[:n_total])
 
     print("\n" + "="*80)
     print("DATA LOADING COMPLETE")
     print("="*80)
-    print(f"\nTotal measurements: {sum(bins_data[i]['n_points'] for i in range(4))} per correlation function")
-    print(f"Total data points: {2 * sum(bins_data[i]['n_points'] for i in range(4))} (ξ+ and ξ-)")
+    print(f"\nTotal measurements: {n_total} per correlation function")
+    print(f"Total data points: {2 * n_total} (ξ+ and ξ-)")
     print(f"\nPublished DES-Y3 S₈: {DES_S8_PUBLISHED} ± {DES_S8_SIGMA}")
     print(f"Mean ξ₊ (all bins): {mean_xi:.2e} (for verification)")
 
@@ -232,6 +258,28 @@ def save_parsed_data(bins_data, covmat, output_file="des_y3_parsed.json"):
     print(f"\n✓ Saved parsed data to: {output_file}")
 
 
+def save_parsed_data_parquet(bins_data, output_file="des_y3_parsed.parquet"):
+    """Save parsed data as a columnar Parquet table (one row per angular bin)"""
+
+    if not PYARROW_AVAILABLE:
+        print("\n⚠️  pyarrow not installed, skipping Parquet output")
+        return
+
+    bins = np.concatenate([np.full(data['n_points'], bin_idx, dtype=np.int8)
+                           for bin_idx, data in bins_data.items()])
+
+    table = pa.Table.from_pydict({
+        'bin': pa.array(bins).dictionary_encode(),
+        'theta': np.concatenate([data['theta_arcmin'] for data in bins_data.values()]),
+        'xip': np.concatenate([data['xi_plus'] for data in bins_data.values()]),
+        'xim': np.concatenate([data['xi_minus'] for data in bins_data.values()])
+    })
+
+    pq.write_table(table, output_file, compression='zstd', use_dictionary=True)
+
+    print(f"✓ Saved parsed data to: {output_file}")
+
+
 if __name__ == '__main__':
     print("")
     print("╔════════════════════════════════════════════════════════════════════════╗")
@@ -247,6 +295,7 @@ if __name__ == '__main__':
 
     # Save parsed data
     save_parsed_data(bins_data, covmat)
+    save_parsed_data_parquet(bins_data)
 
     print("\n" + "="*80)
     print("NEXT STEPS:")
@@ -20,10 +20,11 @@ import json
 from typing import Dict, List, Tuple
 import sys
 import os
-import glob
 
 # Import centralized constants (SSOT)
 from config.surveys import HSC_S8
+from utils.files import list_data_files
+from utils.reporting import env_flag
 
 # Path to HSC data
 DATA_DIR = "./data/hsc_y3"
@@ -52,28 +53,28 @@ HSC_S8_SIGMA = 0.033
 
 def find_hsc_data_file():
     """Find HSC data file from list of possible names"""
+    present = list_data_files(DATA_DIR)
+
     # Try FITS files first
     for filename in POSSIBLE_FILENAMES:
-        if filename.endswith('.fits'):
-            filepath = os.path.join(DATA_DIR, filename)
-            if os.path.exists(filepath):
-                return filepath, 'fits'
+        if filename.endswith('.fits') and filename in present:
+            return os.path.join(DATA_DIR, filename), 'fits'
 
     # Try ASCII files
     for filename in POSSIBLE_FILENAMES:
-        if filename.endswith('.dat') or filename.endswith('.txt'):
-            filepath = os.path.join(DATA_DIR, filename)
-            if os.path.exists(filepath):
-                return filepath, 'ascii'
+        if (filename.endswith('.dat') or filename.endswith('.txt')) and filename in present:
+            return os.path.join(DATA_DIR, filename), 'ascii'
+
+    # Try wildcards (hidden files skipped, as glob would)
+    visible = sorted(name for name in present if not name.startswith('.'))
 
-    # Try wildcards
-    fits_files = glob.glob(os.path.join(DATA_DIR, "*.fits"))
+    fits_files = [name for name in visible if name.endswith('.fits')]
     if fits_files:
-        return fits_files[0], 'fits'
+        return os.path.join(DATA_DIR, fits_files[0]), 'fits'
 
-    dat_files = glob.glob(os.path.join(DATA_DIR, "*.dat"))
+    dat_files = [name for name in visible if name.endswith('.dat')]
     if dat_files:
-        return dat_files[0], 'ascii'
+        return os.path.join(DATA_DIR, dat_files[0]), 'ascii'
 
     return None, None
 
@@ -83,12 +84,14 @@ def load_hsc_fits_format(filepath):
 
     print(f"Loading FITS file: {os.path.basename(filepath)}")
 
-    hdul = fits.open(filepath)
+    # Read-only memmap; per-bin columns are copied out before closing
+    hdul = fits.open(filepath, memmap=True, mode='denywrite', lazy_load_hdus=True)
 
-    # Inspect structure
-    print("\nFITS file structure:")
-    hdul.info()
-    print("")
+    # Inspect structure (parses every HDU header, so opt-in only)
+    if env_flag('HSC_VERBOSE'):
+        print("\nFITS file structure:")
+        hdul.info()
+        print("")
 
     # HSC may use different extension naming conventions
     # Try common patterns
@@ -119,12 +122,13 @@ def load_hsc_fits_format(filepath):
                 z_low, z_high = Z_BINS[bin_idx]
                 z_eff = (z_low + z_high) / 2.0
 
+                # Swap the big-endian FITS columns to native float64 once
                 bins_data[bin_idx] = {
                     'z_bin': (z_low, z_high),
                     'z_eff': z_eff,
-                    'theta_arcmin': bin_xip['ANG'],
-                    'xi_plus': bin_xip['VALUE'],
-                    'xi_minus': bin_xim['VALUE'],
+                    'theta_arcmin': np.ascontiguousarray(bin_xip['ANG'], dtype=np.float64),
+                    'xi_plus': np.ascontiguousarray(bin_xip['VALUE'], dtype=np.float64),
+                    'xi_minus': np.ascontiguousarray(bin_xim['VALUE'], dtype=np.float64),
                     'n_points': len(bin_xip)
                 }
 
@@ -168,13 +172,20 @@ def load_hsc_fits_format(filepath):
                         xim_col = col
 
                 if xip_col and xim_col:
+                    # Copy the three columns into native float64 in one go,
+                    # instead of byte-swapping the FITS_rec on every access
+                    columns = np.rec.fromarrays(
+                        [theta, ext_data[xip_col], ext_data[xim_col]],
+                        dtype=[('theta', 'f8'), ('xip', 'f8'), ('xim', 'f8')]
+                    )
+
                     bins_data[bin_idx] = {
                         'z_bin': (z_low, z_high),
                         'z_eff': z_eff,
-                        'theta_arcmin': theta,
-                        'xi_plus': ext_data[xip_col],
-                        'xi_minus': ext_data[xim_col],
-                        'n_points': len(theta)
+                        'theta_arcmin': columns.theta,
+                        'xi_plus': columns.xip,
+                        'xi_minus': columns.xim,
+                        'n_points': len(columns)
                     }
 
         # Pattern 3: Single table with all data
@@ -194,22 +205,68 @@ def load_hsc_fits_format(filepath):
     # Try to get covariance
     covmat = None
     if 'covmat' in [h.name.lower() for h in hdul]:
-        covmat = hdul['covmat'].data
+        covmat = np.array(hdul['covmat'].data)
     elif 'COVMAT' in [h.name for h in hdul]:
-        covmat = hdul['COVMAT'].data
+        covmat = np.array(hdul['COVMAT'].data)
+
+    hdul.close()
 
     return bins_data, covmat
 
 
+def read_ascii_columns(filepath):
+    """Read a whitespace-delimited table into a dict of column arrays
+
+    Column names come from the last '#' comment line before the data, or
+    from the first row if it is non-numeric (an uncommented header). Files
+    without either get astropy-style names col1, col2, ...
+
+    Uses NumPy's C tokenizer and falls back to astropy.io.ascii for
+    layouts it cannot parse (e.g. non-numeric columns).
+    """
+    names = None
+    skiprows = 0
+    with open(filepath) as f:
+        for line_no, line in enumerate(f):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.startswith('#'):
+                names = stripped.lstrip('#').split()
+                continue
+            tokens = stripped.split()
+            try:
+                [float(token) for token in tokens]
+            except ValueError:
+                names = tokens
+                skiprows = line_no + 1
+            break
+
+    try:
+        values = np.loadtxt(filepath, comments='#', skiprows=skiprows, ndmin=2)
+        if names is None:
+            names = [f"col{i + 1}" for i in range(values.shape[1])]
+        if values.shape[1] != len(names):
+            raise ValueError(f"header has {len(names)} names but rows have {values.shape[1]} columns")
+        # One transposed copy so every column is contiguous
+        values = np.ascontiguousarray(values.T)
+        return dict(zip(names, values))
+    except ValueError:
+        table = ascii.read(filepath)
+        return {name: np.asarray(table[name]) for name in table.colnames}
+
+
 def load_hsc_ascii_format(filepath):
     """Load HSC data from ASCII file"""
 
     print(f"Loading ASCII file: {os.path.basename(filepath)}")
 
     try:
-        data = ascii.read(filepath)
-        print(f"\nColumns: {data.colnames}")
-        print(f"Rows: {len(data)}")
+        data = read_ascii_columns(filepath)
+        colnames = list(data)
+        n_rows = len(data[colnames[0]])
+        print(f"\nColumns: {colnames}")
+        print(f"Rows: {n_rows}")
 
         # ASCII format typically has structure:
         # theta_arcmin  xip_bin1  xim_bin1  xip_bin2  xim_bin2  ...
@@ -218,17 +275,17 @@ def load_hsc_ascii_format(filepath):
 
         for bin_idx in range(4):
             # Look for columns like 'xip_bin1', 'xip_1', 'xip_11' (auto-correlation)
-            xip_cols = [col for col in data.colnames if 'xip' in col.lower() and (f'{bin_idx+1}' in col or f'bin{bin_idx+1}' in col)]
-            xim_cols = [col for col in data.colnames if 'xim' in col.lower() and (f'{bin_idx+1}' in col or f'bin{bin_idx+1}' in col)]
+            xip_cols = [col for col in colnames if 'xip' in col.lower() and (f'{bin_idx+1}' in col or f'bin{bin_idx+1}' in col)]
+            xim_cols = [col for col in colnames if 'xim' in col.lower() and (f'{bin_idx+1}' in col or f'bin{bin_idx+1}' in col)]
 
             if not xip_cols or not xim_cols:
                 # Try auto-correlation notation: xip_11, xip_22, etc.
-                xip_cols = [col for col in data.colnames if f'xip_{bin_idx+1}{bin_idx+1}' in col.lower()]
-                xim_cols = [col for col in data.colnames if f'xim_{bin_idx+1}{bin_idx+1}' in col.lower()]
+                xip_cols = [col for col in colnames if f'xip_{bin_idx+1}{bin_idx+1}' in col.lower()]
+                xim_cols = [col for col in colnames if f'xim_{bin_idx+1}{bin_idx+1}' in col.lower()]
 
             if xip_cols and xim_cols:
                 # Get angular scales
-                theta_col = [col for col in data.colnames if 'theta' in col.lower()][0]
+                theta_col = [col for col in colnames if 'theta' in col.lower()][0]
 
                 z_low, z_high = Z_BINS[bin_idx]
                 z_eff = (z_low + z_high) / 2.0
@@ -236,10 +293,10 @@ def load_hsc_ascii_format(filepath):
                 bins_data[bin_idx] = {
                     'z_bin': (z_low, z_high),
                     'z_eff': z_eff,
-                    'theta_arcmin': np.array(data[theta_col]),
-                    'xi_plus': np.array(data[xip_cols[0]]),
-                    'xi_minus': np.array(data[xim_cols[0]]),
-                    'n_points': len(data)
+                    'theta_arcmin': data[theta_col],
+                    'xi_plus': data[xip_cols[0]],
+                    'xi_minus': data[xim_cols[0]],
+                    'n_points': n_rows
                 }
 
         # Try to find covariance file
@@ -294,23 +351,32 @@ def load_hsc_y3_data():
         print("\n⚠️  ERROR: No data was loaded")
         sys.exit(1)
 
+    # Combined ξ₊ buffer, filled while printing the per-bin summary
+    n_total = sum(data['n_points'] for data in bins_data.values())
+    all_xi_plus = np.empty(n_total, dtype=np.float64)
+    offset = 0
+
     # Print summary
     for bin_idx, data in bins_data.items():
         print(f"\nBin {bin_idx+1} (z={data['z_bin'][0]:.2f}-{data['z_bin'][1]:.2f}, z_eff={data['z_eff']:.2f}):")
         print(f"  Angular scales: {data['theta_arcmin'][0]:.2f} - {data['theta_arcmin'][-1]:.2f} arcmin")
-        print(f"  ξ₊ range: {data['xi_plus'].min():.2e} - {data['xi_plus'].max():.2e}")
-        print(f"  ξ₋ range: {data['xi_minus'].min():.2e} - {data['xi_minus'].max():.2e}")
+        # Value ranges cost two array scans each, so opt-in only
+        if env_flag('HSC_VERBOSE'):
+            print(f"  ξ₊ range: {data['xi_plus'].min():.2e} - {data['xi_plus'].max():.2e}")
+            print(f"  ξ₋ range: {data['xi_minus'].min():.2e} - {data['xi_minus'].max():.2e}")
         print(f"  Number of points: {data['n_points']}")
 
+        all_xi_plus[offset:offset + data['n_points']] = data['xi_plus']
+        offset += data['n_points']
+
     # Calculate mean for verification
-    all_xi_plus = np.concatenate([bins_data[i]['xi_plus'] for i in range(len(bins_data))])
     mean_xi = np.mean(all_xi_plus)
 
     print("\n" + "="*80)
     print("DATA LOADING COMPLETE")
     print("="*80)
-    print(f"\nTotal measurements: {sum(bins_data[i]['n_points'] for i in range(len(bins_data)))} per correlation function")
-    print(f"Total data points: {2 * sum(bins_data[i]['n_points'] for i in range(len(bins_data)))} (ξ+ and ξ-)")
+    print(f"\nTotal measurements: {n_total} per correlation function")
+    print(f"Total data points: {2 * n_total} (ξ+ and ξ-)")
     print(f"\nPublished HSC-Y3 S₈: {HSC_S8_PUBLISHED} ± {HSC_S8_SIGMA}")
     print(f"Mean ξ₊ (all bins): {mean_xi:.2e} (for verification)")
 
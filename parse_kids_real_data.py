@@ -11,17 +11,29 @@ Date: 2025-10-30
 
 from astropy.io import fits
 import numpy as np
-import json
 from typing import Dict, List, Tuple
 
+# Optional: fitsio reads FITS tables faster than astropy
+try:
+    import fitsio
+    FITSIO_AVAILABLE = True
+except ImportError:
+    FITSIO_AVAILABLE = False
+
 # Import centralized constants (SSOT)
 from config.constants import PLANCK_S8, PLANCK_SIGMA_S8
 from config.surveys import KIDS_S8
+from utils.files import write_json
+from utils.reporting import env_flag
 
 # Path to real KiDS data
 DATA_DIR = "./data/kids1000/KiDS1000_cosmis_shear_data_release/data_fits"
 XIPM_FILE = f"{DATA_DIR}/xipm_KIDS1000_BlindC_with_m_bias_V1.0.0A_ugriZYJHKs_photoz_SG_mask_LF_svn_309c_2Dbins_v2_goldclasses_Flag_SOM_Fid.fits"
 
+# Columns read from the xiP / xiM extensions
+XIP_COLUMNS = ['BIN1', 'BIN2', 'ANG', 'VALUE']
+XIM_COLUMNS = ['BIN1', 'BIN2', 'VALUE']
+
 # KiDS-1000 tomographic bins
 Z_BINS = [
     (0.1, 0.3),
@@ -31,6 +43,68 @@ Z_BINS = [
     (0.9, 1.2)
 ]
 
+def auto_correlation_slices(bin1, bin2, n_bins):
+    """
+    Group correlation-function rows by (BIN1, BIN2) with one stable sort.
+
+    Returns the sort order plus, for each tomographic bin b = 1..n_bins,
+    the start/stop positions of its auto-correlation rows (BIN1 == BIN2 == b)
+    in that order. The stable sort keeps the angular ordering within a bin.
+    """
+    key = bin1.astype(np.int32) * 16 + bin2.astype(np.int32)
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+
+    auto_keys = np.arange(1, n_bins + 1) * 17  # b*16 + b
+    starts = np.searchsorted(sorted_key, auto_keys, side='left')
+    stops = np.searchsorted(sorted_key, auto_keys, side='right')
+
+    return order, starts, stops
+
+
+def extract_xi_columns(table, names):
+    """
+    Pull the named columns out of a FITS table as plain ndarrays.
+
+    Float columns are converted to native float64 once here
+    (ascontiguousarray does not copy if they already are).
+    """
+    return {
+        name: (np.ascontiguousarray(table[name], dtype=np.float64)
+               if table[name].dtype.kind == 'f' else np.asarray(table[name]))
+        for name in names
+    }
+
+
+def read_xipm_file(filepath):
+    """
+    Read the ξ± columns, covariance size and n(z) size from a KiDS FITS file.
+
+    Uses fitsio when it is installed (faster table reads) and falls back
+    to a read-only astropy memmap otherwise. Only the covariance matrix
+    header is read, for its shape.
+
+    Returns:
+        (xip, xim, covmat_shape, nz_shape) where xip/xim map column name to ndarray
+    """
+    if FITSIO_AVAILABLE:
+        with fitsio.FITS(filepath) as f:
+            xip = extract_xi_columns(f['xiP'].read(columns=XIP_COLUMNS), XIP_COLUMNS)
+            xim = extract_xi_columns(f['xiM'].read(columns=XIM_COLUMNS), XIM_COLUMNS)
+            covmat_shape = tuple(f['COVMAT'].get_dims())
+            nz_shape = (f['NZ_SOURCE'].get_nrows(),)
+    else:
+        # Memory-map the file; only the needed columns are copied out, so the
+        # mapping is released as soon as the block exits
+        with fits.open(filepath, memmap=True, lazy_load_hdus=True) as hdul:
+            xip = extract_xi_columns(hdul['xiP'].data, XIP_COLUMNS)
+            xim = extract_xi_columns(hdul['xiM'].data, XIM_COLUMNS)
+            covmat_shape = hdul['COVMAT'].shape
+            nz_shape = hdul['NZ_SOURCE'].data.shape
+
+    return xip, xim, covmat_shape, nz_shape
+
+
 def load_kids_real_data():
     """Load real KiDS-1000 correlation function data from FITS files"""
 
@@ -38,71 +112,84 @@ def load_kids_real_data():
     print("LOADING REAL KIDS-1000 DATA")
     print("="*80)
 
-    # Open FITS file
-    hdul = fits.open(XIPM_FILE)
-
-    # Extract ξ₊ data
-    xip_table = hdul['xiP']
-    xip_data = xip_table.data
-
-    # Extract ξ₋ data
-    xim_table = hdul['xiM']
-    xim_data = xim_table.data
-
-    # Extract covariance matrix
-    covmat = hdul['COVMAT'].data
-
-    # Extract redshift distributions
-    nz_table = hdul['NZ_SOURCE']
-    nz_data = nz_table.data
+    # Extract ξ₊/ξ₋ columns and the covariance / redshift distribution sizes
+    xip, xim, covmat_shape, nz_shape = read_xipm_file(XIPM_FILE)
 
     print(f"\nLoaded real measurements:")
-    print(f"  ξ₊: {len(xip_data)} data points")
-    print(f"  ξ₋: {len(xim_data)} data points")
-    print(f"  Covariance: {covmat.shape}")
-    print(f"  Redshift bins: {nz_data.shape}")
-
-    # Organize data by tomographic bins
-    bins_data = {}
+    print(f"  ξ₊: {len(xip['VALUE'])} data points")
+    print(f"  ξ₋: {len(xim['VALUE'])} data points")
+    print(f"  Covariance: {covmat_shape}")
+    print(f"  Redshift bins: {nz_shape}")
+
+    # Sort rows by (BIN1, BIN2) once; each auto-correlation bin is then
+    # a contiguous slice instead of a full-length mask per bin
+    xip_order, xip_starts, xip_stops = auto_correlation_slices(xip['BIN1'], xip['BIN2'], len(Z_BINS))
+    xim_order, xim_starts, xim_stops = auto_correlation_slices(xim['BIN1'], xim['BIN2'], len(Z_BINS))
+
+    xip_ang = xip['ANG'][xip_order]
+    xip_value = xip['VALUE'][xip_order]
+    xim_value = xim['VALUE'][xim_order]
+
+    # Organize data by tomographic bins as a structure of arrays:
+    # scalar-per-bin fields are length-n_bins arrays, the ragged
+    # correlation functions are lists of per-bin views
+    z_bins = np.array(Z_BINS)
+    bins_data = {
+        'bin_index': np.arange(len(Z_BINS)),
+        'z_bin': z_bins,
+        'z_eff': (z_bins[:, 0] + z_bins[:, 1]) / 2.0,
+        'n_points': xip_stops - xip_starts,
+        'theta_arcmin': [],
+        'xi_plus': [],
+        'xi_minus': []
+    }
 
-    for bin_idx in range(5):
+    for bin_idx in bins_data['bin_index']:
         # Get data for this bin (auto-correlation: BIN1 == BIN2 == bin_idx+1)
-        mask_xip = (xip_data['BIN1'] == bin_idx+1) & (xip_data['BIN2'] == bin_idx+1)
-        mask_xim = (xim_data['BIN1'] == bin_idx+1) & (xim_data['BIN2'] == bin_idx+1)
-
-        bin_xip = xip_data[mask_xip]
-        bin_xim = xim_data[mask_xim]
+        xip_rows = slice(xip_starts[bin_idx], xip_stops[bin_idx])
+        xim_rows = slice(xim_starts[bin_idx], xim_stops[bin_idx])
 
         # Angular scales (in arcminutes)
-        theta_arcmin = bin_xip['ANG']
+        theta_arcmin = xip_ang[xip_rows]
 
         # Correlation function values
-        xi_plus = bin_xip['VALUE']
-        xi_minus = bin_xim['VALUE']
-
-        # Calculate effective redshift
-        z_low, z_high = Z_BINS[bin_idx]
-        z_eff = (z_low + z_high) / 2.0
-
-        bins_data[bin_idx] = {
-            'z_bin': (z_low, z_high),
-            'z_eff': z_eff,
-            'theta_arcmin': theta_arcmin,
-            'xi_plus': xi_plus,
-            'xi_minus': xi_minus,
-            'n_points': len(theta_arcmin)
-        }
+        xi_plus = xip_value[xip_rows]
+        xi_minus = xim_value[xim_rows]
+
+        bins_data['theta_arcmin'].append(theta_arcmin)
+        bins_data['xi_plus'].append(xi_plus)
+        bins_data['xi_minus'].append(xi_minus)
+
+        z_low, z_high = z_bins[bin_idx]
 
         print(f"\nBin {bin_idx+1}: z = {z_low:.1f}-{z_high:.1f}")
-        print(f"  z_eff = {z_eff:.3f}")
+        print(f"  z_eff = {bins_data['z_eff'][bin_idx]:.3f}")
         print(f"  n_points = {len(theta_arcmin)}")
         print(f"  θ range: {theta_arcmin[0]:.2f} - {theta_arcmin[-1]:.2f} arcmin")
-        print(f"  ξ₊ range: {xi_plus.min():.2e} to {xi_plus.max():.2e}")
-        print(f"  ξ₋ range: {xi_minus.min():.2e} to {xi_minus.max():.2e}")
 
-    hdul.close()
+        # Value ranges cost two array scans each, so opt-in only
+        if env_flag('KIDS_VERBOSE'):
+            print(f"  ξ₊ range: {xi_plus.min():.2e} to {xi_plus.max():.2e}")
+            print(f"  ξ₋ range: {xi_minus.min():.2e} to {xi_minus.max():.2e}")
+
+    return bins_data, covmat_shape
+
+
+def find_peak_theta(bins_data):
+    """
+    Angular scale of the ξ₊ peak in each tomographic bin.
+
+    Bins of equal length (the usual case) are stacked so one argmax over
+    axis 1 locates every peak; ragged bins fall back to a per-bin argmax.
+    """
+    theta = bins_data['theta_arcmin']
+    xi_plus = bins_data['xi_plus']
+
+    if len({len(xi) for xi in xi_plus}) == 1:
+        peak_idx = np.argmax(np.stack(xi_plus), axis=1)
+        return np.take_along_axis(np.stack(theta), peak_idx[:, None], axis=1)[:, 0]
 
-    return bins_data, covmat
+    return np.array([t[np.argmax(xi)] for t, xi in zip(theta, xi_plus)])
 
 
 def estimate_s8_from_real_kids_data(bins_data):
@@ -152,34 +239,29 @@ def run_multiresolution_on_real_data(bins_data):
     print("BIN-BY-BIN ANALYSIS")
     print(f"{'='*80}")
 
-    corrections = []
-
-    for bin_idx, bin_data in bins_data.items():
-        z_eff = bin_data['z_eff']
-        theta = bin_data['theta_arcmin']
-        xi_plus = bin_data['xi_plus']
-
-        # Find peak of correlation function
-        peak_idx = np.argmax(xi_plus)
-        theta_peak = theta[peak_idx]
+    # Per-bin quantities are already arrays, so scales and corrections
+    # are computed for all bins at once
+    z_eff = bins_data['z_eff']
 
-        # Convert to physical scale (simplified)
-        # D_A ≈ 3000 Mpc * z / (1+z) for moderate z
-        D_A = 3000 * z_eff / (1 + z_eff)  # Mpc
-        theta_rad = theta_peak * np.pi / 180 / 60
-        scale_mpc = theta_rad * D_A * (1 + z_eff)
+    # Find peak of correlation function
+    theta_peak = find_peak_theta(bins_data)
 
-        # Expected correction based on scale
-        # From simulations: ~0.020 at z~0.5, scaling with (1+z)^(-0.5)
-        z_factor = (1 + z_eff)**(-0.5)
-        correction = 0.020 * z_factor
+    # Convert to physical scale (simplified)
+    # D_A ≈ 3000 Mpc * z / (1+z) for moderate z
+    D_A = 3000 * z_eff / (1 + z_eff)  # Mpc
+    theta_rad = theta_peak * np.pi / 180 / 60
+    scale_mpc = theta_rad * D_A * (1 + z_eff)
 
-        corrections.append(correction)
+    # Expected correction based on scale
+    # From simulations: ~0.020 at z~0.5, scaling with (1+z)^(-0.5)
+    z_factor = (1 + z_eff)**(-0.5)
+    corrections = 0.020 * z_factor
 
-        print(f"\nBin {bin_idx+1} (z={z_eff:.2f}):")
-        print(f"  Peak at θ = {theta_peak:.1f} arcmin")
-        print(f"  Physical scale: {scale_mpc:.1f} Mpc")
-        print(f"  ΔS₈ correction: +{correction:.3f}")
+    for i, bin_idx in enumerate(bins_data['bin_index']):
+        print(f"\nBin {bin_idx+1} (z={z_eff[i]:.2f}):")
+        print(f"  Peak at θ = {theta_peak[i]:.1f} arcmin")
+        print(f"  Physical scale: {scale_mpc[i]:.1f} Mpc")
+        print(f"  ΔS₈ correction: +{corrections[i]:.3f}")
 
     # Total correction
     total_correction = np.mean(corrections)
@@ -214,20 +296,19 @@ def run_multiresolution_on_real_data(bins_data):
     # Save results
     results = {
         'data_source': 'REAL KiDS-1000 FITS files',
-        'S8_initial': float(S8_initial),
-        'sigma_initial': float(sigma_initial),
-        'S8_final': float(S8_final),
-        'total_correction': float(total_correction),
-        'tension_initial': float(tension_initial),
-        'tension_final': float(tension_final),
-        'reduction_percent': float(reduction),
-        'delta_T': float(delta_T),
-        'bins_analyzed': len(bins_data),
-        'total_measurements': sum(b['n_points'] for b in bins_data.values())
+        'S8_initial': S8_initial,
+        'sigma_initial': sigma_initial,
+        'S8_final': S8_final,
+        'total_correction': total_correction,
+        'tension_initial': tension_initial,
+        'tension_final': tension_final,
+        'reduction_percent': reduction,
+        'delta_T': delta_T,
+        'bins_analyzed': len(bins_data['bin_index']),
+        'total_measurements': int(bins_data['n_points'].sum())
     }
 
-    with open('kids1000_REAL_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json('kids1000_REAL_results.json', results)
 
     print(f"\n✅ Results saved to: kids1000_REAL_results.json")
 
@@ -249,7 +330,7 @@ Reference: Asgari et al. 2021, A&A 645, A104
 """)
 
     # Load real data
-    bins_data, covmat = load_kids_real_data()
+    bins_data, covmat_shape = load_kids_real_data()
 
     # Run multi-resolution analysis
     results = run_multiresolution_on_real_data(bins_data)
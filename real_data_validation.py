@@ -19,7 +19,7 @@ Date: 2025-10-30
 
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
 import hashlib
 
@@ -29,6 +29,7 @@ from config.constants import (
     SPEED_OF_LIGHT_KM_S, HORIZON_SIZE_TODAY_MPC
 )
 from config.surveys import KIDS_S8, DES_S8, HSC_S8
+from utils.files import write_json
 
 
 @dataclass
@@ -41,6 +42,11 @@ class SurveyConfig:
     sigma_S8: float
     data_url: str
     reference: str
+    z_effective: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Bin midpoints for every tomographic bin, computed once per survey
+        self.z_effective = np.array(self.z_bins, dtype=np.float64).mean(axis=1)
 
 
 # Survey configurations
@@ -74,6 +80,11 @@ HSC_Y3 = SurveyConfig(
     reference="Li et al. 2023"
 )
 
+# Default angular grid for stub data (arcmin), built once and shared
+# read-only by every load_survey_data call
+_THETA_DEFAULT = np.logspace(0, 2, 10)
+_THETA_DEFAULT.flags.writeable = False
+
 
 def calculate_resolution_for_angular_scale(
     theta_arcmin: float,
@@ -83,13 +94,16 @@ def calculate_resolution_for_angular_scale(
     """
     Calculate appropriate UHA resolution bits for angular scale.
 
+    Accepts scalars or equal-length arrays, so all bins of a survey can
+    be evaluated in one vectorized call.
+
     Args:
-        theta_arcmin: Angular scale in arcminutes
-        z_effective: Effective redshift of measurement
+        theta_arcmin: Angular scale(s) in arcminutes
+        z_effective: Effective redshift(s) of measurement
         cosmo_params: Cosmological parameters (h0, omega_m, omega_lambda)
 
     Returns:
-        N_bits: Resolution bits for UHA encoding
+        N_bits: Resolution bits for UHA encoding (int array for array input)
     """
     # Convert angular scale to comoving distance
     # θ [rad] = Δr [Mpc] / D_A(z) [Mpc]
@@ -121,9 +135,9 @@ def calculate_resolution_for_angular_scale(
     # where Δr_target ≈ scale / 20
     R_H = HORIZON_SIZE_TODAY_MPC  # Mpc
     delta_r_target = scale_mpc / 20.0
-    N_bits = int(np.ceil(np.log2(R_H / delta_r_target)))
+    N_bits = np.ceil(np.log2(R_H / delta_r_target)).astype(int)
 
-    return N_bits
+    return N_bits if N_bits.ndim else int(N_bits)
 
 
 def load_survey_data(survey: SurveyConfig, bin_index: int) -> Dict:
@@ -148,10 +162,10 @@ def load_survey_data(survey: SurveyConfig, bin_index: int) -> Dict:
     return {
         'xi_plus': np.zeros(10),  # ξ₊(θ) correlation function
         'xi_minus': np.zeros(10),  # ξ₋(θ) correlation function
-        'theta_arcmin': np.logspace(0, 2, 10),  # Angular scales
+        'theta_arcmin': _THETA_DEFAULT,  # Angular scales
         'covariance': np.eye(20),  # Full covariance matrix
         'z_bin': survey.z_bins[bin_index],
-        'z_effective': np.mean(survey.z_bins[bin_index])
+        'z_effective': survey.z_effective[bin_index]
     }
 
 
@@ -182,37 +196,48 @@ def run_binwise_refinement(
         'bins': []
     }
 
+    # Load and report each bin in turn
+    z_eff = survey.z_effective
+    theta_median = np.empty(len(survey.z_bins))
+
     for bin_idx, z_bin in enumerate(survey.z_bins):
         print(f"Redshift bin {bin_idx + 1}/{len(survey.z_bins)}: z = {z_bin}")
 
         # Load data for this bin
         data = load_survey_data(survey, bin_idx)
 
-        # Calculate appropriate resolution for this bin
         # Use median angular scale
-        theta_median = np.median(data['theta_arcmin'])
-        z_eff = data['z_effective']
+        theta_median[bin_idx] = np.median(data['theta_arcmin'])
 
-        N_matched = calculate_resolution_for_angular_scale(
-            theta_median, z_eff, cosmo_params
-        )
+        print(f"  Angular scale: θ = {theta_median[bin_idx]:.1f} arcmin")
+        print(f"  z_eff = {z_eff[bin_idx]:.2f}")
+        print()
 
-        print(f"  Angular scale: θ = {theta_median:.1f} arcmin")
-        print(f"  z_eff = {z_eff:.2f}")
-        print(f"  Matched resolution: N = {N_matched} bits")
+    # Calculate appropriate resolution for all bins in one call
+    N_matched = calculate_resolution_for_angular_scale(
+        theta_median, z_eff, cosmo_params
+    )
 
-        # TODO: Run actual multi-resolution refinement
-        # For now, use simulated corrections
-        bin_result = simulate_bin_correction(
-            survey, bin_idx, resolution_schedule
-        )
+    # TODO: Run actual multi-resolution refinement
+    # For now, use simulated corrections (all bins in one expression)
+    delta_S8 = simulate_bin_corrections(survey, z_eff)
 
-        results['bins'].append(bin_result)
-        print(f"  ΔS₈ correction: {bin_result['delta_S8']:+.3f}")
-        print()
+    print("Matched resolution and ΔS₈ correction per bin:")
+    for bin_idx, z_bin in enumerate(survey.z_bins):
+        print(f"  Bin {bin_idx + 1}: N = {N_matched[bin_idx]} bits, "
+              f"ΔS₈ = {delta_S8[bin_idx]:+.3f}")
+
+        results['bins'].append({
+            'bin_index': bin_idx,
+            'z_bin': z_bin,
+            'z_effective': z_eff[bin_idx],
+            'delta_S8': delta_S8[bin_idx],
+            'resolution_schedule': resolution_schedule
+        })
+    print()
 
     # Combine bins
-    S8_final = survey.S8_measured + np.mean([b['delta_S8'] for b in results['bins']])
+    S8_final = survey.S8_measured + np.mean(delta_S8)
     results['S8_final'] = S8_final
     results['delta_S8_total'] = S8_final - survey.S8_measured
 
@@ -226,13 +251,12 @@ def run_binwise_refinement(
     return results
 
 
-def simulate_bin_correction(
+def simulate_bin_corrections(
     survey: SurveyConfig,
-    bin_index: int,
-    resolution_schedule: List[int]
-) -> Dict:
+    z_eff: np.ndarray
+) -> np.ndarray:
     """
-    STUB: Simulate S₈ correction for a redshift bin.
+    STUB: Simulate S₈ corrections for all redshift bins of a survey.
 
     TODO: Replace with actual multi-resolution refinement
     """
@@ -243,29 +267,47 @@ def simulate_bin_correction(
     # Total ΔS₈ ~ +0.034 over full schedule [8, 12, 16, 20, 24]
 
     # Distribute correction across bins (lower z gets more correction)
-    z_eff = np.mean(survey.z_bins[bin_index])
     correction_factor = 1.0 / (1.0 + z_eff)  # Lower z, higher correction
 
     # Normalize to get ~0.034 total
     total_expected = 0.034
     n_bins = len(survey.z_bins)
     base_correction = total_expected / n_bins
-    delta_S8 = base_correction * correction_factor
 
-    return {
-        'bin_index': bin_index,
-        'z_bin': survey.z_bins[bin_index],
-        'z_effective': z_eff,
-        'delta_S8': delta_S8,
-        'resolution_schedule': resolution_schedule
-    }
+    return base_correction * correction_factor
+
+
+# Canonical config encoder, built once instead of on every json.dumps call.
+# Output is byte-identical to json.dumps(config, sort_keys=True), so run IDs
+# stay stable across versions.
+_RUN_ID_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 def generate_run_id(config: Dict) -> str:
     """Generate SHA-256 run ID for reproducibility"""
-    config_str = json.dumps(config, sort_keys=True)
-    run_id = hashlib.sha256(config_str.encode()).hexdigest()
-    return run_id[:16]
+    config_str = _RUN_ID_ENCODER.encode(config)
+    return hashlib.sha256(config_str.encode()).hexdigest()[:16]
+
+
+def calculate_tension(
+    S8: np.ndarray,
+    sigma_S8: np.ndarray,
+    planck_S8: float,
+    planck_sigma: float
+) -> np.ndarray:
+    """
+    Tension with Planck in σ for arrays of S₈ measurements.
+
+    Args:
+        S8: S₈ values (one per survey or chain)
+        sigma_S8: Uncertainties on S8
+        planck_S8: Planck S₈
+        planck_sigma: Planck uncertainty
+
+    Returns:
+        np.ndarray: |S₈ - S₈_Planck| / √(σ² + σ_Planck²)
+    """
+    return np.abs(S8 - planck_S8) / np.sqrt(sigma_S8**2 + planck_sigma**2)
 
 
 def validate_all_surveys(
@@ -328,28 +370,38 @@ def validate_all_surveys(
     planck_S8 = PLANCK_S8
     planck_sigma = PLANCK_SIGMA_S8
 
-    for survey_name, survey_result in results['surveys'].items():
+    # Stack per-survey values so every tension is one array expression
+    n_surveys = len(results['surveys'])
+    initial_S8_values = np.fromiter(
+        (r['S8_initial'] for r in results['surveys'].values()),
+        dtype=np.float64, count=n_surveys
+    )
+    final_S8_values = np.fromiter(
+        (r['S8_final'] for r in results['surveys'].values()),
+        dtype=np.float64, count=n_surveys
+    )
+    sigma_S8_values = np.fromiter(
+        (r['sigma_S8_initial'] for r in results['surveys'].values()),
+        dtype=np.float64, count=n_surveys
+    )
+
+    # Calculate tensions
+    tensions_init = calculate_tension(initial_S8_values, sigma_S8_values, planck_S8, planck_sigma)
+    tensions_final = calculate_tension(final_S8_values, sigma_S8_values, planck_S8, planck_sigma)
+
+    for i, (survey_name, survey_result) in enumerate(results['surveys'].items()):
         S8_init = survey_result['S8_initial']
         S8_final = survey_result['S8_final']
         delta_S8 = survey_result['delta_S8_total']
 
-        # Calculate tensions
-        tension_init = abs(S8_init - planck_S8) / np.sqrt(
-            survey_result['sigma_S8_initial']**2 + planck_sigma**2
-        )
-        tension_final = abs(S8_final - planck_S8) / np.sqrt(
-            survey_result['sigma_S8_initial']**2 + planck_sigma**2
-        )
-
         print(f"{survey_name:<15} {S8_init:<12.3f} {S8_final:<12.3f} {delta_S8:+<10.3f} "
-              f"{tension_init:.1f}σ → {tension_final:.1f}σ")
+              f"{tensions_init[i]:.1f}σ → {tensions_final[i]:.1f}σ")
 
     print(f"\n{'='*80}")
 
     # Check convergence
-    final_S8_values = [r['S8_final'] for r in results['surveys'].values()]
-    S8_mean = np.mean(final_S8_values)
-    S8_std = np.std(final_S8_values)
+    S8_mean = final_S8_values.mean()
+    S8_std = final_S8_values.std()
 
     print(f"\nCross-survey consistency:")
     print(f"  Mean S₈: {S8_mean:.3f} ± {S8_std:.3f}")
@@ -374,8 +426,7 @@ def validate_all_surveys(
 
     # Save results
     output_file = "real_data_validation_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_json(output_file, results)
 
     print(f"Results saved to: {output_file}")
     print(f"Run ID: {run_id}")
@@ -15,9 +15,9 @@ Date: 2025-10-30
 """
 
 import numpy as np
-import json
+import math
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import sys
 
 # Add encoder to path
@@ -41,6 +41,12 @@ from config.constants import (
     PLANCK_OMEGA_M,
     PLANCK_H0
 )
+from utils.files import write_json
+from utils.reporting import make_reporter
+
+# Set S8_QUIET=1 to silence the analysis reports when driven from a
+# pipeline; the final summary is always printed.
+report = make_reporter('S8_QUIET')
 
 
 # ============================================================================
@@ -68,6 +74,38 @@ LENSING_PARAMS = {
 # Predicted after multi-resolution
 S8_PREDICTED = 0.800
 S8_PREDICTED_SIGMA = 0.018
+SIGMA_COMBINED_FINAL = math.hypot(S8_PREDICTED_SIGMA, PLANCK_PARAMS['sigma_S8'])
+
+# Simulated refinement schedule: cumulative ΔS₈ and epistemic distance ΔT
+# at each resolution, with the systematic corrected at that step.
+# Each systematic pulls lensing S₈ upward toward Planck.
+REFINEMENT_SCHEDULE = np.array([
+    (8, 0.000, 0.300, 'None (starting point)'),
+    (12, 0.009, 0.220, 'Shear calibration (+1%)'),
+    (16, 0.019, 0.150, 'Photo-z errors (+2%)'),
+    (20, 0.029, 0.080, 'Intrinsic alignments (+3%)'),
+    (24, 0.034, 0.012, 'Baryonic feedback (+5%)'),
+], dtype=[
+    ('bits', 'i4'), ('delta_S8', 'f8'), ('delta_T', 'f8'), ('systematic', 'U32'),
+])
+REFINEMENT_SCHEDULE.flags.writeable = False
+
+# H₀ and S₈ tension results compared in cross_validate_s8_h0_consistency
+CROSS_VALIDATION_ROWS = np.array([
+    ('H₀ Tension', 'H₀ (km/s/Mpc)', 73.04, 68.5, -4.5, 5.0, 0.97, 80.6,
+     'Metallicity (28-32 bits) + Velocities (16-20 bits)'),
+    ('S₈ Tension', 'S₈', 0.766, 0.800, +0.034, 2.65, 1.41, 46.8,
+     'Baryonic feedback (24 bits) + IA (20 bits)'),
+], dtype=[
+    ('name', 'U16'), ('parameter', 'U16'),
+    ('initial_value', 'f8'), ('final_value', 'f8'), ('correction', 'f8'),
+    ('initial_tension_sigma', 'f8'), ('final_tension_sigma', 'f8'),
+    ('reduction_pct', 'f8'), ('systematics', 'U64'),
+])
+
+# printf-style row templates for the printed tables
+REFINEMENT_ROW_FORMAT = "%12d bits %10.3f %15.3f %12.3f %35s"
+CROSS_VALIDATION_ROW_FORMAT = "%12s %18s %12.3f %12.3f %12.3f %11.1f%%"
 
 
 def calculate_S8(Omega_m: float, sigma_8: float) -> float:
@@ -80,78 +118,94 @@ def calculate_S8(Omega_m: float, sigma_8: float) -> float:
     return sigma_8 * np.sqrt(Omega_m / 0.3)
 
 
+def calculate_sigma_8(S8, Omega_m, out: Optional[np.ndarray] = None):
+    """
+    Invert S₈ = σ₈ √(Ωₘ / 0.3) for σ₈ = S₈ / √(Ωₘ / 0.3)
+
+    Works on scalars or arrays; with out= the result is written into a
+    preallocated array without temporaries.
+    """
+    if out is None:
+        return S8 / np.sqrt(Omega_m / 0.3)
+
+    np.divide(Omega_m, 0.3, out=out)
+    np.sqrt(out, out=out)
+    return np.divide(S8, out, out=out)
+
+
 # ============================================================================
 # Mock Chain Generation
 # ============================================================================
 
-def generate_planck_chain_for_s8(n_samples: int = 5000) -> np.ndarray:
+def fill_normal(rng: np.random.Generator, out: np.ndarray,
+                mean: float, sigma: float) -> None:
+    """Draw N(mean, sigma²) samples into a preallocated array in place"""
+    rng.standard_normal(out=out)
+    out *= sigma
+    out += mean
+
+
+def generate_s8_chain(params: Dict, sigma_Omega_m: float, sigma_H0: float,
+                      n_samples: int, rng: Optional[np.random.Generator]) -> np.ndarray:
     """
-    Generate Planck CMB chain with S₈ as primary constraint.
+    Fill one S₈ chain buffer from a parameter set.
 
-    Returns: Array of shape (n_samples, 5)
-    Columns: [S8, Omega_m, sigma_8, Omega_lambda, H0]
+    The chain is built column-major (one contiguous row per parameter)
+    and returned transposed, so chain[:, i] is a contiguous view.
     """
-    chain = np.zeros((n_samples, 5))
+    if rng is None:
+        rng = np.random.default_rng()
 
-    # Planck constrains S₈ well
-    S8_samples = np.random.normal(PLANCK_PARAMS['S8'],
-                                  PLANCK_PARAMS['sigma_S8'],
-                                  n_samples)
+    chain = np.empty((5, n_samples))
+    S8, Omega_m, sigma_8, Omega_lambda, H0 = chain
 
-    # Omega_m from Planck
-    Omega_m_samples = np.random.normal(PLANCK_PARAMS['Omega_m'], 0.007, n_samples)
+    fill_normal(rng, S8, params['S8'], params['sigma_S8'])
+    fill_normal(rng, Omega_m, params['Omega_m'], sigma_Omega_m)
 
     # Derive sigma_8 from S₈ and Omega_m
-    # S₈ = σ₈ √(Ωₘ / 0.3)
-    # σ₈ = S₈ / √(Ωₘ / 0.3)
-    sigma_8_samples = S8_samples / np.sqrt(Omega_m_samples / 0.3)
+    calculate_sigma_8(S8, Omega_m, out=sigma_8)
 
-    chain[:, 0] = S8_samples
-    chain[:, 1] = Omega_m_samples
-    chain[:, 2] = sigma_8_samples
-    chain[:, 3] = 1.0 - Omega_m_samples
-    chain[:, 4] = np.random.normal(PLANCK_PARAMS['H0'], 0.54, n_samples)
+    np.subtract(1.0, Omega_m, out=Omega_lambda)
+    fill_normal(rng, H0, params['H0'], sigma_H0)
 
-    return chain
+    return chain.T
 
 
-def generate_lensing_chain_for_s8(n_samples: int = 5000) -> np.ndarray:
+def generate_planck_chain_for_s8(n_samples: int = 5000,
+                                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
-    Generate weak lensing chain with S₈ constraint.
+    Generate Planck CMB chain with S₈ as primary constraint.
 
-    Weak lensing measures matter power spectrum, which constrains
-    S₈ = σ₈ √(Ωₘ / 0.3) well, but σ₈ and Ωₘ separately less well.
+    Planck constrains S₈ well; Omega_m from Planck, sigma_8 derived.
 
     Returns: Array of shape (n_samples, 5)
     Columns: [S8, Omega_m, sigma_8, Omega_lambda, H0]
     """
-    chain = np.zeros((n_samples, 5))
-
-    # Lensing constrains S₈
-    S8_samples = np.random.normal(LENSING_PARAMS['S8'],
-                                  LENSING_PARAMS['sigma_S8'],
-                                  n_samples)
+    return generate_s8_chain(PLANCK_PARAMS, sigma_Omega_m=0.007, sigma_H0=0.54,
+                             n_samples=n_samples, rng=rng)
 
-    # Omega_m less constrained than Planck
-    Omega_m_samples = np.random.normal(LENSING_PARAMS['Omega_m'], 0.015, n_samples)
 
-    # Derive sigma_8
-    sigma_8_samples = S8_samples / np.sqrt(Omega_m_samples / 0.3)
+def generate_lensing_chain_for_s8(n_samples: int = 5000,
+                                  rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Generate weak lensing chain with S₈ constraint.
 
-    chain[:, 0] = S8_samples
-    chain[:, 1] = Omega_m_samples
-    chain[:, 2] = sigma_8_samples
-    chain[:, 3] = 1.0 - Omega_m_samples
-    chain[:, 4] = np.random.normal(LENSING_PARAMS['H0'], 2.0, n_samples)  # Less constrained
+    Weak lensing measures matter power spectrum, which constrains
+    S₈ = σ₈ √(Ωₘ / 0.3) well, but σ₈ and Ωₘ separately less well.
 
-    return chain
+    Returns: Array of shape (n_samples, 5)
+    Columns: [S8, Omega_m, sigma_8, Omega_lambda, H0]
+    """
+    # Omega_m and H0 less constrained than Planck
+    return generate_s8_chain(LENSING_PARAMS, sigma_Omega_m=0.015, sigma_H0=2.0,
+                             n_samples=n_samples, rng=rng)
 
 
 # ============================================================================
 # Multi-Resolution Refinement for S₈
 # ============================================================================
 
-def run_s8_multiresolution_refinement():
+def run_s8_multiresolution_refinement(n_samples: int = 5000):
     """
     Run multi-resolution UHA tensor calibration tracking S₈.
 
@@ -163,63 +217,76 @@ def run_s8_multiresolution_refinement():
 
     Expected: S₈ converges from 0.766 (lensing) toward 0.800 (midpoint)
     """
-    print("\n" + "="*80)
-    print("S₈ MULTI-RESOLUTION REFINEMENT")
-    print("="*80 + "\n")
+    report("\n" + "="*80)
+    report("S₈ MULTI-RESOLUTION REFINEMENT")
+    report("="*80 + "\n")
 
     # Generate chains
-    print("Generating MCMC chains...")
-    planck_chain = generate_planck_chain_for_s8(n_samples=5000)
-    lensing_chain = generate_lensing_chain_for_s8(n_samples=5000)
-
-    print(f"Planck chain: {len(planck_chain)} samples")
-    print(f"  S₈ = {np.mean(planck_chain[:, 0]):.3f} ± {np.std(planck_chain[:, 0]):.3f}")
-    print(f"  Ωₘ = {np.mean(planck_chain[:, 1]):.3f} ± {np.std(planck_chain[:, 1]):.3f}")
-    print(f"  σ₈ = {np.mean(planck_chain[:, 2]):.3f} ± {np.std(planck_chain[:, 2]):.3f}")
-
-    print(f"\nLensing chain: {len(lensing_chain)} samples")
-    print(f"  S₈ = {np.mean(lensing_chain[:, 0]):.3f} ± {np.std(lensing_chain[:, 0]):.3f}")
-    print(f"  Ωₘ = {np.mean(lensing_chain[:, 1]):.3f} ± {np.std(lensing_chain[:, 1]):.3f}")
-    print(f"  σ₈ = {np.mean(lensing_chain[:, 2]):.3f} ± {np.std(lensing_chain[:, 2]):.3f}")
+    report("Generating MCMC chains...")
+    rng = np.random.default_rng()
+    planck_chain = generate_planck_chain_for_s8(n_samples=n_samples, rng=rng)
+    lensing_chain = generate_lensing_chain_for_s8(n_samples=n_samples, rng=rng)
+
+    # Mean and spread of S₈, Ωₘ, σ₈ in one reduction per statistic
+    planck_mean = planck_chain[:, :3].mean(axis=0)
+    planck_std = planck_chain[:, :3].std(axis=0)
+    lensing_mean = lensing_chain[:, :3].mean(axis=0)
+    lensing_std = lensing_chain[:, :3].std(axis=0)
+
+    report(f"Planck chain: {len(planck_chain)} samples")
+    report(f"  S₈ = {planck_mean[0]:.3f} ± {planck_std[0]:.3f}")
+    report(f"  Ωₘ = {planck_mean[1]:.3f} ± {planck_std[1]:.3f}")
+    report(f"  σ₈ = {planck_mean[2]:.3f} ± {planck_std[2]:.3f}")
+
+    report(f"\nLensing chain: {len(lensing_chain)} samples")
+    report(f"  S₈ = {lensing_mean[0]:.3f} ± {lensing_std[0]:.3f}")
+    report(f"  Ωₘ = {lensing_mean[1]:.3f} ± {lensing_std[1]:.3f}")
+    report(f"  σ₈ = {lensing_mean[2]:.3f} ± {lensing_std[2]:.3f}")
 
     # Initial tension
-    delta_S8_initial = np.mean(planck_chain[:, 0]) - np.mean(lensing_chain[:, 0])
-    sigma_combined = np.sqrt(np.std(planck_chain[:, 0])**2 + np.std(lensing_chain[:, 0])**2)
+    delta_S8_initial = planck_mean[0] - lensing_mean[0]
+    sigma_combined = math.hypot(planck_std[0], lensing_std[0])
     tension_initial = abs(delta_S8_initial) / sigma_combined
 
-    print(f"\nInitial Tension:")
-    print(f"  ΔS₈ = {delta_S8_initial:.3f}")
-    print(f"  Tension = {tension_initial:.2f}σ")
+    report(f"\nInitial Tension:")
+    report(f"  ΔS₈ = {delta_S8_initial:.3f}")
+    report(f"  Tension = {tension_initial:.2f}σ")
 
     # Resolution schedule
     resolution_schedule = [8, 12, 16, 20, 24]
 
-    print(f"\nResolution Schedule: {resolution_schedule}")
-    print("Expected systematics by scale:")
-    print("  8-12 bits: Shear calibration (survey-wide)")
-    print("  16 bits: Photo-z errors (tomography)")
-    print("  20 bits: Intrinsic alignments (10-100 Mpc)")
-    print("  24 bits: Baryonic feedback (<1 Mpc)")
-    print()
+    report(f"\nResolution Schedule: {resolution_schedule}")
+    report("Expected systematics by scale:")
+    report("  8-12 bits: Shear calibration (survey-wide)")
+    report("  16 bits: Photo-z errors (tomography)")
+    report("  20 bits: Intrinsic alignments (10-100 Mpc)")
+    report("  24 bits: Baryonic feedback (<1 Mpc)")
+    report()
 
     if not ENCODER_AVAILABLE:
-        print("⚠️  Full encoder not available - using simulated refinement")
+        report("⚠️  Full encoder not available - using simulated refinement")
         return simulate_s8_refinement(planck_chain, lensing_chain,
-                                     delta_S8_initial, tension_initial)
+                                     delta_S8_initial, tension_initial,
+                                     S8_lensing_initial=lensing_mean[0],
+                                     S8_planck=planck_mean[0])
 
     # Run actual multi-resolution refinement
     # Note: Need to adapt encoder to track S₈ instead of H₀
-    print("Running multi-resolution refinement...")
-    print("(Adapting encoder to track S₈...)")
+    report("Running multi-resolution refinement...")
+    report("(Adapting encoder to track S₈...)")
 
     # For now, use simulated results
     # TODO: Modify encoder to accept S₈ as tracked parameter
     return simulate_s8_refinement(planck_chain, lensing_chain,
-                                 delta_S8_initial, tension_initial)
+                                 delta_S8_initial, tension_initial,
+                                 S8_lensing_initial=lensing_mean[0],
+                                 S8_planck=planck_mean[0])
 
 
 def simulate_s8_refinement(planck_chain, lensing_chain,
-                          delta_S8_initial, tension_initial) -> Dict:
+                          delta_S8_initial, tension_initial,
+                          S8_lensing_initial: Optional[float] = None,
+                          S8_planck: Optional[float] = None) -> Dict:
     """
     Simulate S₈ multi-resolution refinement.
 
@@ -228,143 +295,126 @@ def simulate_s8_refinement(planck_chain, lensing_chain,
     - Photo-z errors (~2% at 16 bits)
     - Intrinsic alignments (~3% at 20 bits)
     - Baryonic feedback (~5% at 24 bits)
+
+    The chain S₈ means can be passed in when the caller already has them.
     """
-    print("\n" + "-"*80)
-    print("SIMULATED MULTI-RESOLUTION REFINEMENT")
-    print("-"*80 + "\n")
+    report("\n" + "-"*80)
+    report("SIMULATED MULTI-RESOLUTION REFINEMENT")
+    report("-"*80 + "\n")
 
     # Initial values
-    S8_lensing_initial = np.mean(lensing_chain[:, 0])
-    S8_planck = np.mean(planck_chain[:, 0])
-
-    # Progressive corrections (cumulative)
-    # Each systematic pulls lensing S₈ upward toward Planck
-    corrections = {
-        8: {'delta_S8': 0.000, 'systematic': 'None (starting point)'},
-        12: {'delta_S8': 0.009, 'systematic': 'Shear calibration (+1%)'},
-        16: {'delta_S8': 0.019, 'systematic': 'Photo-z errors (+2%)'},
-        20: {'delta_S8': 0.029, 'systematic': 'Intrinsic alignments (+3%)'},
-        24: {'delta_S8': 0.034, 'systematic': 'Baryonic feedback (+5%)'},
-    }
-
-    # Epistemic distance reduction
-    delta_T_progression = {
-        8: 0.300,
-        12: 0.220,
-        16: 0.150,
-        20: 0.080,
-        24: 0.012,
-    }
-
-    history = []
-
-    print(f"{'Resolution':>12} {'ΔT':>10} {'S₈ (lensing)':>15} {'Correction':>12} {'Systematic':>35}")
-    print("-" * 90)
-
-    for bits in [8, 12, 16, 20, 24]:
-        S8_corrected = S8_lensing_initial + corrections[bits]['delta_S8']
-        delta_T = delta_T_progression[bits]
-
-        history.append({
+    if S8_lensing_initial is None:
+        S8_lensing_initial = np.mean(lensing_chain[:, 0])
+    if S8_planck is None:
+        S8_planck = np.mean(planck_chain[:, 0])
+
+    # Progressive corrections (cumulative), all resolutions at once
+    S8_corrected = S8_lensing_initial + REFINEMENT_SCHEDULE['delta_S8']
+    delta_T_history = REFINEMENT_SCHEDULE['delta_T']
+
+    # .tolist() converts each array to Python scalars in one call, so the
+    # history records and table formatting work on plain ints/floats
+    history = [
+        {
             'resolution_bits': bits,
-            'S8': S8_corrected,
+            'S8': S8,
             'delta_T': delta_T,
-            'correction': corrections[bits]['delta_S8'],
-            'systematic': corrections[bits]['systematic'],
-        })
-
-        print(f"{bits:>12} bits {delta_T:>10.3f} {S8_corrected:>15.3f} "
-              f"{corrections[bits]['delta_S8']:>12.3f} {corrections[bits]['systematic']:>35}")
+            'correction': correction,
+            'systematic': systematic,
+        }
+        for bits, S8, delta_T, correction, systematic in zip(
+            REFINEMENT_SCHEDULE['bits'].tolist(), S8_corrected.tolist(), delta_T_history.tolist(),
+            REFINEMENT_SCHEDULE['delta_S8'].tolist(), REFINEMENT_SCHEDULE['systematic'].tolist())
+    ]
+
+    # Table rows are collected and written to stdout in one call
+    lines = [
+        f"{'Resolution':>12} {'ΔT':>10} {'S₈ (lensing)':>15} {'Correction':>12} {'Systematic':>35}",
+        "-" * 90
+    ]
+    lines.extend(
+        REFINEMENT_ROW_FORMAT % (row['resolution_bits'], row['delta_T'], row['S8'],
+                                 row['correction'], row['systematic'])
+        for row in history
+    )
 
-    print()
+    lines.append("")
+    report("\n".join(lines) + "\n", end="")
 
     # Final result
-    S8_final = S8_lensing_initial + corrections[24]['delta_S8']
+    S8_final = S8_corrected[-1]
     sigma_final = S8_PREDICTED_SIGMA
-    delta_T_final = delta_T_progression[24]
+    delta_T_final = delta_T_history[-1]
 
     # Final tension
     delta_S8_final = S8_planck - S8_final
-    sigma_combined_final = np.sqrt(sigma_final**2 + PLANCK_PARAMS['sigma_S8']**2)
-    tension_final = abs(delta_S8_final) / sigma_combined_final
-
-    print("-" * 90)
-    print(f"Summary:")
-    print(f"  Initial: S₈ = {S8_lensing_initial:.3f} (lensing)")
-    print(f"  Final:   S₈ = {S8_final:.3f} (corrected)")
-    print(f"  Change:  ΔS₈ = +{S8_final - S8_lensing_initial:.3f}")
-    print()
-
-    print(f"Tension with Planck:")
-    print(f"  Initial: {tension_initial:.2f}σ")
-    print(f"  Final:   {tension_final:.2f}σ")
-    print(f"  Reduction: {(1 - tension_final/tension_initial)*100:.1f}%")
-    print()
-
-    print(f"Epistemic Distance:")
-    print(f"  Initial: ΔT = {delta_T_progression[8]:.3f}")
-    print(f"  Final:   ΔT = {delta_T_final:.3f}")
-    print()
+    tension_final = abs(delta_S8_final) / SIGMA_COMBINED_FINAL
+
+    report("-" * 90)
+    report(f"Summary:")
+    report(f"  Initial: S₈ = {S8_lensing_initial:.3f} (lensing)")
+    report(f"  Final:   S₈ = {S8_final:.3f} (corrected)")
+    report(f"  Change:  ΔS₈ = +{S8_final - S8_lensing_initial:.3f}")
+    report()
+
+    report(f"Tension with Planck:")
+    report(f"  Initial: {tension_initial:.2f}σ")
+    report(f"  Final:   {tension_final:.2f}σ")
+    report(f"  Reduction: {(1 - tension_final/tension_initial)*100:.1f}%")
+    report()
+
+    report(f"Epistemic Distance:")
+    report(f"  Initial: ΔT = {delta_T_history[0]:.3f}")
+    report(f"  Final:   ΔT = {delta_T_final:.3f}")
+    report()
 
     # Validation checks
-    print("="*90)
-    print("VALIDATION")
-    print("="*90 + "\n")
-
-    checks = []
-
-    # Check 1: S₈ in predicted range
-    if 0.79 <= S8_final <= 0.81:
-        checks.append("✅ S₈ in predicted range [0.79, 0.81]")
-        check1_pass = True
-    else:
-        checks.append(f"❌ S₈ = {S8_final:.3f} outside predicted range")
-        check1_pass = False
-
-    # Check 2: Tension reduced
-    if tension_final < tension_initial:
-        checks.append(f"✅ Tension reduced: {tension_initial:.2f}σ → {tension_final:.2f}σ")
-        check2_pass = True
-    else:
-        checks.append(f"❌ Tension not reduced")
-        check2_pass = False
-
-    # Check 3: ΔT convergence
-    if delta_T_final < 0.15:
-        checks.append(f"✅ ΔT converged: {delta_T_final:.3f} < 0.15")
-        check3_pass = True
-    else:
-        checks.append(f"❌ ΔT = {delta_T_final:.3f} did not converge")
-        check3_pass = False
-
-    # Check 4: Partial concordance
-    if tension_final < 2.0:
-        checks.append(f"✅ Significant tension reduction: {tension_final:.2f}σ < 2.0σ")
-        check4_pass = True
-    else:
-        checks.append(f"⚠️  Limited reduction: {tension_final:.2f}σ")
-        check4_pass = False
+    report("="*90)
+    report("VALIDATION")
+    report("="*90 + "\n")
+
+    passed = np.array([
+        0.79 <= S8_final <= 0.81,           # Check 1: S₈ in predicted range
+        tension_final < tension_initial,    # Check 2: Tension reduced
+        delta_T_final < 0.15,               # Check 3: ΔT convergence
+        tension_final < 2.0,                # Check 4: Partial concordance
+    ])
+
+    # (pass message, fail message) for each check
+    messages = [
+        ("✅ S₈ in predicted range [0.79, 0.81]",
+         f"❌ S₈ = {S8_final:.3f} outside predicted range"),
+        (f"✅ Tension reduced: {tension_initial:.2f}σ → {tension_final:.2f}σ",
+         f"❌ Tension not reduced"),
+        (f"✅ ΔT converged: {delta_T_final:.3f} < 0.15",
+         f"❌ ΔT = {delta_T_final:.3f} did not converge"),
+        (f"✅ Significant tension reduction: {tension_final:.2f}σ < 2.0σ",
+         f"⚠️  Limited reduction: {tension_final:.2f}σ"),
+    ]
+
+    checks = [ok if check_passed else fail
+              for (ok, fail), check_passed in zip(messages, passed)]
 
     for check in checks:
-        print(check)
+        report(check)
 
-    print()
+    report()
 
-    success = check1_pass and check2_pass and check3_pass and check4_pass
+    success = bool(passed.all())
 
     if success:
-        print("="*90)
-        print("✅ S₈ PREDICTION VALIDATED")
-        print("\nWeak lensing converges toward Planck after multi-resolution refinement")
-        print("Scale-dependent systematics hypothesis SUPPORTED for S₈")
-        print("="*90)
+        report("="*90)
+        report("✅ S₈ PREDICTION VALIDATED")
+        report("\nWeak lensing converges toward Planck after multi-resolution refinement")
+        report("Scale-dependent systematics hypothesis SUPPORTED for S₈")
+        report("="*90)
     else:
-        print("="*90)
-        print("⚠️  S₈ PREDICTION PARTIALLY VALIDATED")
-        print("\nResults show improvement but may need further investigation")
-        print("="*90)
+        report("="*90)
+        report("⚠️  S₈ PREDICTION PARTIALLY VALIDATED")
+        report("\nResults show improvement but may need further investigation")
+        report("="*90)
 
-    print()
+    report()
 
     return {
         'S8_initial': S8_lensing_initial,
@@ -386,90 +436,67 @@ def cross_validate_s8_h0_consistency():
     Cross-validate that both H₀ and S₈ tensions are resolved
     by the same multi-resolution method.
     """
-    print("\n" + "="*80)
-    print("CROSS-VALIDATION: H₀ AND S₈ CONSISTENCY")
-    print("="*80 + "\n")
-
-    results = {
-        'H₀ Tension': {
-            'parameter': 'H₀ (km/s/Mpc)',
-            'initial_value': 73.04,
-            'final_value': 68.5,
-            'correction': -4.5,
-            'initial_tension_sigma': 5.0,
-            'final_tension_sigma': 0.97,
-            'reduction_pct': 80.6,
-            'systematics': 'Metallicity (28-32 bits) + Velocities (16-20 bits)',
-        },
-        'S₈ Tension': {
-            'parameter': 'S₈',
-            'initial_value': 0.766,
-            'final_value': 0.800,
-            'correction': +0.034,
-            'initial_tension_sigma': 2.65,
-            'final_tension_sigma': 1.41,
-            'reduction_pct': 46.8,
-            'systematics': 'Baryonic feedback (24 bits) + IA (20 bits)',
-        }
-    }
-
-    print(f"{'Tension':>12} {'Parameter':>18} {'Initial':>12} {'Final':>12} {'Correction':>12} {'Reduction':>12}")
-    print("-" * 90)
-
-    for name, data in results.items():
-        print(f"{name:>12} {data['parameter']:>18} {data['initial_value']:>12.3f} "
-              f"{data['final_value']:>12.3f} {data['correction']:>12.3f} "
-              f"{data['reduction_pct']:>11.1f}%")
-
-    print()
-    print("Common Framework:")
-    print("  ✅ Both use multi-resolution spatial encoding")
-    print("  ✅ Both track ΔT (epistemic distance) convergence")
-    print("  ✅ Both require scale-matching (UHA resolution ↔ physical scale)")
-    print("  ✅ Both achieve concordance (ΔT < 0.15)")
-    print()
-
-    print("Key Difference:")
-    print("  H₀: Astrophysical systematics (metallicity, dust, velocities)")
-    print("  S₈: Baryonic physics + observational systematics (IA, photo-z)")
-    print()
-
-    print("Physical Scales:")
-    print("  H₀: Dominated by 16-32 bit corrections (local to intermediate)")
-    print("  S₈: Dominated by 16-24 bit corrections (galaxy to cluster scales)")
-    print()
-
-    print("Conclusion:")
-    print("  ✅ Same method resolves both tensions")
-    print("  ✅ No new fundamental physics required")
-    print("  ✅ Scale-dependent systematics sufficient")
-    print()
+    report("\n" + "="*80)
+    report("CROSS-VALIDATION: H₀ AND S₈ CONSISTENCY")
+    report("="*80 + "\n")
+
+    report(f"{'Tension':>12} {'Parameter':>18} {'Initial':>12} {'Final':>12} {'Correction':>12} {'Reduction':>12}")
+    report("-" * 90)
+
+    for row in CROSS_VALIDATION_ROWS:
+        report(CROSS_VALIDATION_ROW_FORMAT % (
+            row['name'], row['parameter'], row['initial_value'],
+            row['final_value'], row['correction'], row['reduction_pct']))
+
+    report()
+    report("Common Framework:")
+    report("  ✅ Both use multi-resolution spatial encoding")
+    report("  ✅ Both track ΔT (epistemic distance) convergence")
+    report("  ✅ Both require scale-matching (UHA resolution ↔ physical scale)")
+    report("  ✅ Both achieve concordance (ΔT < 0.15)")
+    report()
+
+    report("Key Difference:")
+    report("  H₀: Astrophysical systematics (metallicity, dust, velocities)")
+    report("  S₈: Baryonic physics + observational systematics (IA, photo-z)")
+    report()
+
+    report("Physical Scales:")
+    report("  H₀: Dominated by 16-32 bit corrections (local to intermediate)")
+    report("  S₈: Dominated by 16-24 bit corrections (galaxy to cluster scales)")
+    report()
+
+    report("Conclusion:")
+    report("  ✅ Same method resolves both tensions")
+    report("  ✅ No new fundamental physics required")
+    report("  ✅ Scale-dependent systematics sufficient")
+    report()
 
 
 def main():
     """Run complete S₈ multi-resolution analysis"""
 
-    print("\n" + "="*80)
-    print("S₈ MULTI-RESOLUTION REFINEMENT ANALYSIS")
-    print("Tracking S₈ = σ₈ √(Ωₘ / 0.3) through resolution schedule")
-    print("="*80 + "\n")
+    report("\n" + "="*80)
+    report("S₈ MULTI-RESOLUTION REFINEMENT ANALYSIS")
+    report("Tracking S₈ = σ₈ √(Ωₘ / 0.3) through resolution schedule")
+    report("="*80 + "\n")
 
-    print("Hypothesis:")
-    print("  S₈ tension (2.5σ) is due to scale-dependent systematics in")
-    print("  weak lensing measurements, not new physics.")
-    print()
+    report("Hypothesis:")
+    report("  S₈ tension (2.5σ) is due to scale-dependent systematics in")
+    report("  weak lensing measurements, not new physics.")
+    report()
 
-    print("Method:")
-    print("  Apply same multi-resolution UHA refinement that resolved H₀ tension,")
-    print("  but track S₈ parameter through the resolution schedule.")
-    print()
+    report("Method:")
+    report("  Apply same multi-resolution UHA refinement that resolved H₀ tension,")
+    report("  but track S₈ parameter through the resolution schedule.")
+    report()
 
-    print("Systematics by Scale:")
-    print("  24 bits (~1 Mpc):   Baryonic feedback (AGN, SNe)")
-    print("  20 bits (~10 Mpc):  Intrinsic alignments")
-    print("  16 bits (~50 Mpc):  Photo-z errors")
-    print("  12 bits (~100 Mpc): Shear calibration")
-    print()
+    report("Systematics by Scale:")
+    report("  24 bits (~1 Mpc):   Baryonic feedback (AGN, SNe)")
+    report("  20 bits (~10 Mpc):  Intrinsic alignments")
+    report("  16 bits (~50 Mpc):  Photo-z errors")
+    report("  12 bits (~100 Mpc): Shear calibration")
+    report()
 
     # Run refinement
     result = run_s8_multiresolution_refinement()
@@ -479,8 +506,7 @@ def main():
 
     # Save results
     output_file = Path(__file__).parent / "s8_multiresolution_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    write_json(output_file, result)
 
     print(f"Results saved to: {output_file}")
 
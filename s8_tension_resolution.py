@@ -18,7 +18,7 @@ Date: 2025-10-30
 """
 
 import numpy as np
-import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 import math
@@ -33,6 +33,12 @@ from config.surveys import (
     KIDS_S8 as KIDS_S8_PUBLISHED,
     DES_S8 as DES_S8_PUBLISHED
 )
+from utils.files import write_json
+from utils.reporting import make_reporter
+
+# Set S8_QUIET=1 to silence the analysis reports when driven from a
+# pipeline; the final summary is always printed.
+report = make_reporter('S8_QUIET')
 
 
 # ============================================================================
@@ -46,19 +52,104 @@ LENSING_S8_SIGMA = 0.020
 
 # Current tension
 DELTA_S8 = PLANCK_S8 - LENSING_S8  # 0.068
-SIGMA_COMBINED = np.sqrt(PLANCK_S8_SIGMA**2 + LENSING_S8_SIGMA**2)
+SIGMA_COMBINED = math.hypot(PLANCK_S8_SIGMA, LENSING_S8_SIGMA)
 TENSION_SIGMA = DELTA_S8 / SIGMA_COMBINED  # 2.5σ
 
 # Prediction after multi-resolution
 S8_PREDICTED = 0.800
 S8_PREDICTED_SIGMA = 0.018
+SIGMA_COMBINED_FINAL = math.hypot(S8_PREDICTED_SIGMA, PLANCK_S8_SIGMA)
+
+# printf-style row templates for the printed tables
+SCALE_ROW_FORMAT = "%8d %15.1f %12d %30s"
+SCHEDULE_ROW_FORMAT = "%12d bits %12d %15.1f %25s"
+CONVERGENCE_ROW_FORMAT = "%12d bits %10.3f %12.3f %35s"
+SYSTEMATIC_ROW_FORMAT = "%25s %15.1f %15s %11.1f%% %12d"
+CONTRIBUTION_ROW_FORMAT = "%25s %20.4f"
+TENSION_COMPARISON_ROW_FORMAT = "%15s %9.2fσ %9.2fσ %11.1f%% %40s"
+
+# Fixed-text report blocks; the templated ones are filled with str.format_map
+BACKGROUND_TEXT = """
+================================================================================
+S₈ TENSION RESOLUTION
+Multi-Resolution UHA Tensor Calibration
+================================================================================
+
+Background:
+  The S₈ = σ₈(Ωₘ/0.3)^0.5 parameter measures structure growth
+  Planck CMB predicts S₈ = 0.834 (early universe)
+  Weak lensing measures S₈ = 0.766 (late universe)
+  2.5σ tension suggests:
+    a) Modified gravity (changes growth rate)
+    b) Early dark energy (changes expansion history)
+    c) Scale-dependent systematics in measurements ← Our hypothesis
+
+"""
+
+SYSTEMATICS_SUMMARY_TEMPLATE = """{rule}
+       Total (linear sum) {total_delta_S8:>20.4f}
+             Observed ΔS₈ {observed_delta_S8:>20.4f}
+
+Systematics explain {explained_pct:.1f}% of tension
+{verdict}
+
+"""
+
+CROSS_VALIDATION_NOTES = """
+Consistency Check:
+  ✅ Both tensions reduced by same method
+  ✅ Both involve scale-dependent systematics
+  ✅ Neither requires new fundamental physics
+
+Physical Interpretation:
+  H₀: Metallicity (local) + Velocities (intermediate)
+  S₈: Baryonic feedback (small scale) + Intrinsic alignments (medium scale)
+
+Conclusion:
+  Same underlying principle: Multi-scale systematic decomposition
+  Different physical sources, same mathematical framework
+  ✅ CROSS-VALIDATION SUCCESSFUL
+
+"""
+
+SUMMARY_TEMPLATE = """
+{rule}
+S₈ TENSION RESOLUTION SUMMARY
+{rule}
+
+✅ PREDICTION: S₈ tension reduced from {tension_initial:.2f}σ to {tension_final:.2f}σ
+
+  S₈: {S8_initial:.3f} → {S8_final:.3f}
+  Reduction: {reduction_pct:.1f}%
+  ΔT: 0.30 → {delta_T_final:.3f}
+
+  Physical Mechanism:
+    - Baryonic feedback on <1 Mpc scales
+    - Intrinsic alignments on 10-100 Mpc scales
+    - Photo-z errors affecting tomography
+
+  Cross-Validation:
+    ✅ Same method resolves H₀ tension (5σ → 0.97σ)
+    ✅ Same method resolves S₈ tension (2.5σ → 1.4σ)
+    ✅ No new physics required
+
+  Status: READY FOR VALIDATION WITH REAL DATA
+{rule}
+
+"""
+
+# H₀ and S₈ tensions compared in cross_validate_h0_s8 (S₈ final is predicted)
+TENSION_COMPARISON_ROWS = np.array([
+    ('H₀ Tension', 5.0, 0.97, 'Scale-dependent astrophysical systematics'),
+    ('S₈ Tension', 2.5, 1.4, 'Scale-dependent astrophysical systematics'),
+], dtype=[('name', 'U16'), ('initial_sigma', 'f8'), ('final_sigma', 'f8'), ('hypothesis', 'U64')])
 
 
 # ============================================================================
 # Multipole to UHA Resolution Mapping
 # ============================================================================
 
-def multipole_to_physical_scale(ell: int, z: float = 0.5) -> float:
+def multipole_to_physical_scale(ell, z: float = 0.5):
     """
     Convert multipole ℓ to physical scale in Mpc
 
@@ -70,29 +161,39 @@ def multipole_to_physical_scale(ell: int, z: float = 0.5) -> float:
 
     For z ~ 0.5: χ ~ 1500 Mpc
     λ ~ π × 1500 / ℓ Mpc
+
+    Works on a scalar ℓ or elementwise on an array of multipoles.
     """
     chi_z = 1500.0  # Mpc, comoving distance at z~0.5
     scale_mpc = np.pi * chi_z / ell
     return scale_mpc
 
 
-def map_multipole_to_uha_resolution(ell: int) -> int:
+def multipoles_to_uha_resolution(ells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Map weak lensing multipole ℓ to appropriate UHA resolution
+    Map weak lensing multipoles ℓ to physical scales and UHA resolutions
 
     UHA spec: N = ⌈log₂(R_H / Δr_target)⌉
     R_H = 14,000 Mpc (centralized constant)
+
+    Returns:
+        (scale_mpc, resolution_bits) arrays, one entry per ℓ
     """
-    R_H = HORIZON_SIZE_TODAY_MPC
-    scale_mpc = multipole_to_physical_scale(ell)
+    scale_mpc = multipole_to_physical_scale(np.asarray(ells, dtype=np.float64))
 
     # Target cell size: ~1/20 of measurement scale
     delta_r_target = scale_mpc / 20.0
 
     # Resolution bits
-    N = math.ceil(math.log2(R_H / delta_r_target))
+    bits = np.ceil(np.log2(HORIZON_SIZE_TODAY_MPC / delta_r_target)).astype(int)
 
-    return N
+    return scale_mpc, bits
+
+
+def map_multipole_to_uha_resolution(ell: int) -> int:
+    """Map a single multipole ℓ to its UHA resolution (see multipoles_to_uha_resolution)"""
+    _, bits = multipoles_to_uha_resolution(ell)
+    return int(bits)
 
 
 # ============================================================================
@@ -131,6 +232,41 @@ WEAK_LENSING_SYSTEMATICS = {
 }
 
 
+def _build_systematic_ell_lookup(systematics: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten (possibly overlapping) inclusive ell_range entries into disjoint segments.
+
+    Segment i covers edges[i] <= ℓ < edges[i+1] and is labelled with the first
+    systematic in dict order whose range contains it, so a binary search over
+    edges gives the same answer as walking the dict.
+    """
+    edges = np.unique([
+        bound
+        for info in systematics.values()
+        for bound in (info['ell_range'][0], info['ell_range'][1] + 1)
+    ])
+
+    names = []
+    for ell in edges:
+        systematic = "None"
+        for name, info in systematics.items():
+            if info['ell_range'][0] <= ell <= info['ell_range'][1]:
+                systematic = name
+                break
+        names.append(systematic)
+
+    return edges, np.array(names)
+
+
+SYSTEMATIC_ELL_EDGES, SYSTEMATIC_ELL_NAMES = _build_systematic_ell_lookup(WEAK_LENSING_SYSTEMATICS)
+
+
+def dominant_systematics(ells: np.ndarray) -> np.ndarray:
+    """Dominant weak lensing systematic for each multipole ℓ ("None" if no range covers it)"""
+    idx = np.searchsorted(SYSTEMATIC_ELL_EDGES, ells, side='right') - 1
+    return np.where(idx >= 0, SYSTEMATIC_ELL_NAMES[np.maximum(idx, 0)], "None")
+
+
 # ============================================================================
 # Multi-Resolution Analysis for S₈
 # ============================================================================
@@ -139,106 +275,112 @@ def analyze_s8_by_scale():
     """
     Analyze how different physical scales contribute to S₈ tension
     """
-    print("\n" + "="*80)
-    print("S₈ TENSION: SCALE-DEPENDENT ANALYSIS")
-    print("="*80 + "\n")
+    report("\n" + "="*80)
+    report("S₈ TENSION: SCALE-DEPENDENT ANALYSIS")
+    report("="*80 + "\n")
 
-    print(f"Current State:")
-    print(f"  Planck CMB: S₈ = {PLANCK_S8:.3f} ± {PLANCK_S8_SIGMA:.3f}")
-    print(f"  Weak Lensing: S₈ = {LENSING_S8:.3f} ± {LENSING_S8_SIGMA:.3f}")
-    print(f"  Difference: ΔS₈ = {DELTA_S8:.3f}")
-    print(f"  Tension: {TENSION_SIGMA:.2f}σ")
-    print()
+    report(f"Current State:")
+    report(f"  Planck CMB: S₈ = {PLANCK_S8:.3f} ± {PLANCK_S8_SIGMA:.3f}")
+    report(f"  Weak Lensing: S₈ = {LENSING_S8:.3f} ± {LENSING_S8_SIGMA:.3f}")
+    report(f"  Difference: ΔS₈ = {DELTA_S8:.3f}")
+    report(f"  Tension: {TENSION_SIGMA:.2f}σ")
+    report()
 
     # Map multipoles to scales
-    print("Weak Lensing Multipole → Physical Scale → UHA Resolution:")
-    print(f"{'ℓ':>8} {'Scale (Mpc)':>15} {'UHA Bits':>12} {'Dominant Systematic':>30}")
-    print("-" * 80)
+    report("Weak Lensing Multipole → Physical Scale → UHA Resolution:")
+    report(f"{'ℓ':>8} {'Scale (Mpc)':>15} {'UHA Bits':>12} {'Dominant Systematic':>30}")
+    report("-" * 80)
 
-    ells = [50, 100, 300, 1000, 3000, 5000]
-    for ell in ells:
-        scale = multipole_to_physical_scale(ell)
-        bits = map_multipole_to_uha_resolution(ell)
+    ells = np.array([50, 100, 300, 1000, 3000, 5000])
+    scales, resolution_bits = multipoles_to_uha_resolution(ells)
 
-        # Find dominant systematic at this scale
-        systematic = "None"
-        for name, sys_info in WEAK_LENSING_SYSTEMATICS.items():
-            if sys_info['ell_range'][0] <= ell <= sys_info['ell_range'][1]:
-                systematic = name
-                break
+    # Find dominant systematic at each scale
+    systematics = dominant_systematics(ells)
 
-        print(f"{ell:>8} {scale:>15.1f} {bits:>12} {systematic:>30}")
+    for ell, scale, bits, systematic in zip(ells.tolist(), scales.tolist(),
+                                            resolution_bits.tolist(), systematics.tolist()):
+        report(SCALE_ROW_FORMAT % (ell, scale, bits, systematic))
 
-    print()
+    report()
 
 
 def predict_s8_convergence():
     """
     Predict S₈ convergence after multi-resolution refinement
     """
-    print("\n" + "="*80)
-    print("MULTI-RESOLUTION PREDICTION FOR S₈")
-    print("="*80 + "\n")
+    report("\n" + "="*80)
+    report("MULTI-RESOLUTION PREDICTION FOR S₈")
+    report("="*80 + "\n")
 
     # Resolution schedule for weak lensing
     # Map from global (ℓ~100) to small scales (ℓ~5000)
     resolution_schedule = [8, 12, 16, 20, 24]
 
-    print("Resolution Schedule:")
-    print(f"{'Resolution':>12} {'ℓ Range':>12} {'Scale (Mpc)':>15} {'Systematic':>25}")
-    print("-" * 70)
+    # Table rows are collected and written to stdout in one call
+    lines = [
+        "Resolution Schedule:",
+        f"{'Resolution':>12} {'ℓ Range':>12} {'Scale (Mpc)':>15} {'Systematic':>25}",
+        "-" * 70
+    ]
 
-    schedule_info = []
-    for bits in resolution_schedule:
-        # Typical ℓ for this resolution
-        R_H = HORIZON_SIZE_TODAY_MPC
-        delta_r = R_H / (2 ** bits)
-        chi_z = 1500.0
-        ell_typical = int(np.pi * chi_z / delta_r)
+    # Typical ℓ for every resolution at once
+    R_H = HORIZON_SIZE_TODAY_MPC
+    chi_z = 1500.0
+    delta_r_all = R_H / 2.0 ** np.array(resolution_schedule)
+    ell_all = (np.pi * chi_z / delta_r_all).astype(int)
 
-        # Find systematic
-        systematic = "None"
-        for name, sys_info in WEAK_LENSING_SYSTEMATICS.items():
-            if sys_info['resolution_bits'] == bits:
-                systematic = name
-                break
+    # Systematic corrected at each resolution (first match in dict order)
+    systematic_by_bits = {}
+    for name, sys_info in WEAK_LENSING_SYSTEMATICS.items():
+        systematic_by_bits.setdefault(sys_info['resolution_bits'], name)
 
-        schedule_info.append({
+    schedule_info = [
+        {
             'bits': bits,
             'ell': ell_typical,
             'scale_mpc': delta_r,
-            'systematic': systematic
-        })
+            'systematic': systematic_by_bits.get(bits, "None")
+        }
+        for bits, delta_r, ell_typical in zip(resolution_schedule, delta_r_all.tolist(), ell_all.tolist())
+    ]
 
-        print(f"{bits:>12} bits {ell_typical:>12} {delta_r:>15.1f} {systematic:>25}")
+    lines.extend(
+        SCHEDULE_ROW_FORMAT % (info['bits'], info['ell'], info['scale_mpc'], info['systematic'])
+        for info in schedule_info
+    )
 
-    print()
+    lines.append("")
+    report("\n".join(lines) + "\n", end="")
 
     # Simulate progressive convergence
-    print("Progressive Convergence (Simulated):")
-    print(f"{'Resolution':>12} {'ΔT':>10} {'S₈':>12} {'Systematic Corrected':>35}")
-    print("-" * 75)
+    lines = [
+        "Progressive Convergence (Simulated):",
+        f"{'Resolution':>12} {'ΔT':>10} {'S₈':>12} {'Systematic Corrected':>35}",
+        "-" * 75
+    ]
 
     # Starting from lensing value, converge toward Planck
     S8_values = [LENSING_S8, 0.775, 0.785, 0.795, 0.800]
     delta_T_values = [0.30, 0.22, 0.15, 0.08, 0.012]
 
-    history = []
-    for i, bits in enumerate(resolution_schedule):
-        S8_current = S8_values[i]
-        delta_T = delta_T_values[i]
-        systematic = schedule_info[i]['systematic']
-
-        history.append({
+    history = [
+        {
             'resolution_bits': bits,
             'S8': S8_current,
             'delta_T': delta_T,
-            'systematic': systematic
-        })
+            'systematic': info['systematic']
+        }
+        for bits, S8_current, delta_T, info in zip(
+            resolution_schedule, S8_values, delta_T_values, schedule_info)
+    ]
 
-        print(f"{bits:>12} bits {delta_T:>10.3f} {S8_current:>12.3f} {systematic:>35}")
+    lines.extend(
+        CONVERGENCE_ROW_FORMAT % (row['resolution_bits'], row['delta_T'], row['S8'], row['systematic'])
+        for row in history
+    )
 
-    print()
+    lines.append("")
+    report("\n".join(lines) + "\n", end="")
 
     # Final prediction
     S8_final = S8_PREDICTED
@@ -246,26 +388,25 @@ def predict_s8_convergence():
     delta_T_final = 0.012
 
     delta_S8_final = S8_final - PLANCK_S8
-    sigma_combined_final = np.sqrt(sigma_final**2 + PLANCK_S8_SIGMA**2)
-    tension_final = abs(delta_S8_final) / sigma_combined_final
-
-    print("-" * 75)
-    print(f"Final Result:")
-    print(f"  S₈ (initial): {LENSING_S8:.3f} ± {LENSING_S8_SIGMA:.3f}")
-    print(f"  S₈ (final):   {S8_final:.3f} ± {sigma_final:.3f}")
-    print(f"  Change:       {S8_final - LENSING_S8:+.3f}")
-    print()
-
-    print(f"Tension with Planck:")
-    print(f"  Initial: {TENSION_SIGMA:.2f}σ")
-    print(f"  Final:   {tension_final:.2f}σ")
-    print(f"  Reduction: {(1 - tension_final/TENSION_SIGMA)*100:.1f}%")
-    print()
-
-    print(f"Epistemic Distance:")
-    print(f"  Initial: ΔT ≈ 0.30")
-    print(f"  Final:   ΔT = {delta_T_final:.3f}")
-    print()
+    tension_final = abs(delta_S8_final) / SIGMA_COMBINED_FINAL
+
+    report("-" * 75)
+    report(f"Final Result:")
+    report(f"  S₈ (initial): {LENSING_S8:.3f} ± {LENSING_S8_SIGMA:.3f}")
+    report(f"  S₈ (final):   {S8_final:.3f} ± {sigma_final:.3f}")
+    report(f"  Change:       {S8_final - LENSING_S8:+.3f}")
+    report()
+
+    report(f"Tension with Planck:")
+    report(f"  Initial: {TENSION_SIGMA:.2f}σ")
+    report(f"  Final:   {tension_final:.2f}σ")
+    report(f"  Reduction: {(1 - tension_final/TENSION_SIGMA)*100:.1f}%")
+    report()
+
+    report(f"Epistemic Distance:")
+    report(f"  Initial: ΔT ≈ 0.30")
+    report(f"  Final:   ΔT = {delta_T_final:.3f}")
+    report()
 
     return {
         'S8_initial': LENSING_S8,
@@ -282,123 +423,81 @@ def analyze_physical_systematics():
     """
     Analyze physical origin of each systematic
     """
-    print("\n" + "="*80)
-    print("PHYSICAL SYSTEMATICS IN WEAK LENSING")
-    print("="*80 + "\n")
+    report("\n" + "="*80)
+    report("PHYSICAL SYSTEMATICS IN WEAK LENSING")
+    report("="*80 + "\n")
 
-    print(f"{'Systematic':>25} {'Scale (Mpc)':>15} {'ℓ Range':>15} {'Amplitude':>12} {'UHA Bits':>12}")
-    print("-" * 85)
+    report(f"{'Systematic':>25} {'Scale (Mpc)':>15} {'ℓ Range':>15} {'Amplitude':>12} {'UHA Bits':>12}")
+    report("-" * 85)
 
     for name, sys_info in WEAK_LENSING_SYSTEMATICS.items():
-        print(f"{name:>25} {sys_info['scale_mpc']:>15.1f} "
-              f"{str(sys_info['ell_range']):>15} "
-              f"{sys_info['amplitude_pct']:>11.1f}% "
-              f"{sys_info['resolution_bits']:>12}")
+        report(SYSTEMATIC_ROW_FORMAT % (name, sys_info['scale_mpc'], str(sys_info['ell_range']),
+                                       sys_info['amplitude_pct'], sys_info['resolution_bits']))
 
-    print()
+    report()
 
     # Expected ΔS₈ from each systematic
-    print("\nExpected Contribution to ΔS₈:")
-    print(f"{'Systematic':>25} {'ΔS₈ Contribution':>20}")
-    print("-" * 50)
+    report("\nExpected Contribution to ΔS₈:")
+    report(f"{'Systematic':>25} {'ΔS₈ Contribution':>20}")
+    report("-" * 50)
 
-    total_delta_S8 = 0.0
-    for name, sys_info in WEAK_LENSING_SYSTEMATICS.items():
-        # Rough estimate: amplitude_pct → ΔS₈
-        # Power spectrum amplitude affects S₈ ~ sqrt(P)
-        # 5% in P → ~2.5% in S₈
-        delta_S8_contrib = (sys_info['amplitude_pct'] / 2.0) / 100.0 * LENSING_S8
-
-        total_delta_S8 += delta_S8_contrib
+    # Rough estimate: amplitude_pct → ΔS₈
+    # Power spectrum amplitude affects S₈ ~ sqrt(P)
+    # 5% in P → ~2.5% in S₈
+    amplitude_pct = np.fromiter((sys_info['amplitude_pct'] for sys_info in WEAK_LENSING_SYSTEMATICS.values()),
+                                dtype=np.float64, count=len(WEAK_LENSING_SYSTEMATICS))
+    delta_S8_contribs = (amplitude_pct / 2.0) / 100.0 * LENSING_S8
 
-        print(f"{name:>25} {delta_S8_contrib:>20.4f}")
+    # All four systematics bias lensing S₈ low, so their shifts add linearly
+    total_delta_S8 = delta_S8_contribs.sum()
 
-    print("-" * 50)
-    print(f"{'Total (quadrature sum)':>25} {total_delta_S8:>20.4f}")
-    print(f"{'Observed ΔS₈':>25} {DELTA_S8:>20.4f}")
-    print()
+    for name, delta_S8_contrib in zip(WEAK_LENSING_SYSTEMATICS, delta_S8_contribs.tolist()):
+        report(CONTRIBUTION_ROW_FORMAT % (name, delta_S8_contrib))
 
     # Check if systematics can explain tension
     explained_fraction = total_delta_S8 / DELTA_S8
-    print(f"Systematics explain {explained_fraction*100:.1f}% of tension")
 
     if explained_fraction > 0.8:
-        print("✅ Scale-dependent systematics SUFFICIENT to explain tension")
+        verdict = "✅ Scale-dependent systematics SUFFICIENT to explain tension"
     elif explained_fraction > 0.5:
-        print("⚠️  Systematics explain MOST of tension")
+        verdict = "⚠️  Systematics explain MOST of tension"
     else:
-        print("❌ Systematics INSUFFICIENT - may need new physics")
+        verdict = "❌ Systematics INSUFFICIENT - may need new physics"
 
-    print()
+    report(SYSTEMATICS_SUMMARY_TEMPLATE.format_map({
+        'rule': "-" * 50,
+        'total_delta_S8': total_delta_S8,
+        'observed_delta_S8': DELTA_S8,
+        'explained_pct': explained_fraction * 100,
+        'verdict': verdict,
+    }), end="")
 
 
 def cross_validate_h0_s8():
     """
     Cross-validate: Same method resolves both H₀ and S₈ tensions
     """
-    print("\n" + "="*80)
-    print("CROSS-VALIDATION: H₀ AND S₈ TENSIONS")
-    print("="*80 + "\n")
-
-    comparisons = {
-        'H₀ Tension': {
-            'initial_sigma': 5.0,
-            'final_sigma': 0.97,
-            'reduction_pct': (1 - 0.97/5.0) * 100,
-            'hypothesis': 'Scale-dependent astrophysical systematics'
-        },
-        'S₈ Tension': {
-            'initial_sigma': 2.5,
-            'final_sigma': 1.4,  # Predicted
-            'reduction_pct': (1 - 1.4/2.5) * 100,
-            'hypothesis': 'Scale-dependent astrophysical systematics'
-        }
-    }
+    report("\n" + "="*80)
+    report("CROSS-VALIDATION: H₀ AND S₈ TENSIONS")
+    report("="*80 + "\n")
 
-    print(f"{'Tension':>15} {'Initial':>10} {'Final':>10} {'Reduction':>12} {'Hypothesis':>40}")
-    print("-" * 92)
+    # Reduction for every tension at once
+    reduction_pct = (1 - TENSION_COMPARISON_ROWS['final_sigma'] / TENSION_COMPARISON_ROWS['initial_sigma']) * 100
 
-    for name, data in comparisons.items():
-        print(f"{name:>15} {data['initial_sigma']:>9.2f}σ {data['final_sigma']:>9.2f}σ "
-              f"{data['reduction_pct']:>11.1f}% {data['hypothesis']:>40}")
+    report(f"{'Tension':>15} {'Initial':>10} {'Final':>10} {'Reduction':>12} {'Hypothesis':>40}")
+    report("-" * 92)
 
-    print()
+    for row, reduction in zip(TENSION_COMPARISON_ROWS, reduction_pct):
+        report(TENSION_COMPARISON_ROW_FORMAT % (
+            row['name'], row['initial_sigma'], row['final_sigma'], reduction, row['hypothesis']))
 
-    print("Consistency Check:")
-    print("  ✅ Both tensions reduced by same method")
-    print("  ✅ Both involve scale-dependent systematics")
-    print("  ✅ Neither requires new fundamental physics")
-    print()
-
-    print("Physical Interpretation:")
-    print("  H₀: Metallicity (local) + Velocities (intermediate)")
-    print("  S₈: Baryonic feedback (small scale) + Intrinsic alignments (medium scale)")
-    print()
-
-    print("Conclusion:")
-    print("  Same underlying principle: Multi-scale systematic decomposition")
-    print("  Different physical sources, same mathematical framework")
-    print("  ✅ CROSS-VALIDATION SUCCESSFUL")
-    print()
+    report(CROSS_VALIDATION_NOTES, end="")
 
 
 def main():
     """Run complete S₈ tension analysis"""
 
-    print("\n" + "="*80)
-    print("S₈ TENSION RESOLUTION")
-    print("Multi-Resolution UHA Tensor Calibration")
-    print("="*80 + "\n")
-
-    print("Background:")
-    print("  The S₈ = σ₈(Ωₘ/0.3)^0.5 parameter measures structure growth")
-    print("  Planck CMB predicts S₈ = 0.834 (early universe)")
-    print("  Weak lensing measures S₈ = 0.766 (late universe)")
-    print("  2.5σ tension suggests:")
-    print("    a) Modified gravity (changes growth rate)")
-    print("    b) Early dark energy (changes expansion history)")
-    print("    c) Scale-dependent systematics in measurements ← Our hypothesis")
-    print()
+    report(BACKGROUND_TEXT, end="")
 
     # Analyses
     analyze_s8_by_scale()
@@ -408,32 +507,20 @@ def main():
 
     # Save results
     output_file = Path(__file__).parent / "s8_tension_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    write_json(output_file, result)
 
     print(f"Results saved to: {output_file}")
 
     # Final summary
-    print("\n" + "="*80)
-    print("S₈ TENSION RESOLUTION SUMMARY")
-    print("="*80)
-    print(f"\n✅ PREDICTION: S₈ tension reduced from {TENSION_SIGMA:.2f}σ to {result['tension_final']:.2f}σ")
-    print(f"\n  S₈: {result['S8_initial']:.3f} → {result['S8_final']:.3f}")
-    print(f"  Reduction: {(1 - result['tension_final']/TENSION_SIGMA)*100:.1f}%")
-    print(f"  ΔT: 0.30 → {result['delta_T_final']:.3f}")
-    print()
-    print("  Physical Mechanism:")
-    print("    - Baryonic feedback on <1 Mpc scales")
-    print("    - Intrinsic alignments on 10-100 Mpc scales")
-    print("    - Photo-z errors affecting tomography")
-    print()
-    print("  Cross-Validation:")
-    print("    ✅ Same method resolves H₀ tension (5σ → 0.97σ)")
-    print("    ✅ Same method resolves S₈ tension (2.5σ → 1.4σ)")
-    print("    ✅ No new physics required")
-    print()
-    print("  Status: READY FOR VALIDATION WITH REAL DATA")
-    print("="*80 + "\n")
+    sys.stdout.write(SUMMARY_TEMPLATE.format_map({
+        'rule': "=" * 80,
+        'tension_initial': TENSION_SIGMA,
+        'tension_final': result['tension_final'],
+        'S8_initial': result['S8_initial'],
+        'S8_final': result['S8_final'],
+        'reduction_pct': (1 - result['tension_final'] / TENSION_SIGMA) * 100,
+        'delta_T_final': result['delta_T_final'],
+    }))
 
 
 if __name__ == "__main__":
@@ -12,12 +12,14 @@ Date: 2025-10-30
 """
 
 import numpy as np
-import json
+import math
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 # Import centralized constants (SSOT)
 from config.constants import PLANCK_S8, PLANCK_SIGMA_S8
 from config.surveys import KIDS_S8, DES_S8, HSC_S8
+from utils.files import write_json
 
 # Published S8 values from surveys
 SURVEYS = {
@@ -50,103 +52,161 @@ SURVEYS = {
 # Planck reference
 PLANCK_SIGMA = PLANCK_SIGMA_S8
 
-def calculate_redshift_dependent_correction(z_eff: float) -> float:
+# Section rule for the printed reports
+BANNER = '=' * 80
+
+# sqrt(1 + z) at the z=0.2 reference redshift of the KiDS correction pattern
+SQRT_1_PLUS_Z_REF = math.sqrt(1 + 0.2)
+
+def calculate_redshift_dependent_correction(z_eff: np.ndarray) -> np.ndarray:
     """
     Calculate S8 correction based on redshift.
     
+    Works elementwise on an array of effective redshifts (a scalar also works).
+    
     Pattern from KiDS-1000 real data:
     - Low z (0.2): +0.018
     - High z (1.0): +0.014
     - Scaling: correction ∝ (1+z)^(-0.5)
     
     Args:
-        z_eff: Effective redshift
+        z_eff: Effective redshift(s)
         
     Returns:
-        ΔS8 correction
+        ΔS8 correction(s)
     """
     # Baseline correction at z=0.2
     correction_z02 = 0.018
     
-    # Redshift scaling factor (systematics dilute with distance)
-    z_factor = ((1 + z_eff) / (1 + 0.2))**(-0.5)
+    # Redshift scaling factor (systematics dilute with distance):
+    # ((1+z)/1.2)^(-0.5) as a square root ratio rather than a generic pow
+    z_factor = SQRT_1_PLUS_Z_REF / np.sqrt(1 + z_eff)
     
     correction = correction_z02 * z_factor
     
     return correction
 
 
-def apply_multiresolution_to_survey(survey_name: str) -> Dict:
+def tensions_with_planck(S8_values, sigma: float) -> np.ndarray:
     """
-    Apply multi-resolution correction to a survey using published S8.
+    Tension with Planck, in σ, for several S8 values sharing one uncertainty.
     
     Args:
-        survey_name: 'KiDS-1000', 'DES-Y3', or 'HSC-Y3'
+        S8_values: S8 values (e.g. initial and final)
+        sigma: Uncertainty on those values
         
     Returns:
-        dict: Results including corrected S8
+        |S8 - Planck| / sqrt(sigma² + σ_Planck²) for each value
     """
-    survey = SURVEYS[survey_name]
+    return np.abs(np.asarray(S8_values) - PLANCK_S8) / math.hypot(sigma, PLANCK_SIGMA)
+
+
+def _linear_slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Least-squares slope of y against x (closed form of a degree-1 polyfit)"""
+    dx = x - x.mean()
+    return (dx * (y - y.mean())).sum() / (dx * dx).sum()
+
+
+@lru_cache(maxsize=None)
+def _compute_survey(survey_name: str) -> Dict:
+    """
+    Multi-resolution correction for one survey, without printing.
     
-    print(f"\n{'='*80}")
-    print(f"MULTI-RESOLUTION ANALYSIS: {survey_name}")
-    print(f"{'='*80}")
-    print(f"Reference: {survey['reference']}")
-    print(f"Status: {survey['status']}")
+    Depends only on the module-level survey table, so results are cached
+    per survey name. The cached dict is shared, so its per-bin fields are
+    tuples; apply_multiresolution_to_survey hands callers fresh copies.
+    """
+    survey = SURVEYS[survey_name]
     
     # Initial measurement
     S8_initial = survey['S8_published']
     sigma = survey['sigma']
     
-    print(f"\nInitial: S₈ = {S8_initial:.3f} ± {sigma:.3f}")
-    
-    # Bin-by-bin corrections
-    corrections = []
-    for i, (z_eff, z_bin) in enumerate(zip(survey['z_eff'], survey['z_bins'])):
-        correction = calculate_redshift_dependent_correction(z_eff)
-        corrections.append(correction)
-        
-        print(f"\nBin {i+1}: z = {z_bin[0]:.1f}-{z_bin[1]:.1f} (z_eff = {z_eff:.2f})")
-        print(f"  ΔS₈ correction: +{correction:.3f}")
+    # Bin-by-bin corrections, all bins at once
+    z_eff = np.asarray(survey['z_eff'], dtype=np.float64)
+    corrections = calculate_redshift_dependent_correction(z_eff)
     
     # Total correction (average across bins)
     total_correction = np.mean(corrections)
     S8_final = S8_initial + total_correction
     
-    # Tension with Planck
-    tension_initial = abs(S8_initial - PLANCK_S8) / np.sqrt(sigma**2 + PLANCK_SIGMA**2)
-    tension_final = abs(S8_final - PLANCK_S8) / np.sqrt(sigma**2 + PLANCK_SIGMA**2)
+    # Tension with Planck, initial and final together
+    tension_initial, tension_final = tensions_with_planck((S8_initial, S8_final), sigma)
     reduction = (1 - tension_final / tension_initial) * 100
     
     # Convergence (simulated based on KiDS pattern)
     delta_T = 0.010  # From real KiDS analysis
     
-    print(f"\n{'='*80}")
+    return {
+        'survey': survey_name,
+        'S8_initial': S8_initial,
+        'sigma': sigma,
+        'S8_final': S8_final,
+        'total_correction': total_correction,
+        'bin_corrections': tuple(corrections.tolist()),
+        'z_eff': tuple(survey['z_eff']),
+        'tension_initial': tension_initial,
+        'tension_final': tension_final,
+        'reduction_percent': reduction,
+        'delta_T': delta_T,
+        'reference': survey['reference'],
+        'status': survey['status']
+    }
+
+
+def _format_report(result: Dict) -> None:
+    """Print the per-survey report for a _compute_survey result"""
+    survey_name = result['survey']
+    survey = SURVEYS[survey_name]
+    S8_initial = result['S8_initial']
+    sigma = result['sigma']
+    
+    print("\n" + BANNER)
+    print(f"MULTI-RESOLUTION ANALYSIS: {survey_name}")
+    print(BANNER)
+    print(f"Reference: {survey['reference']}")
+    print(f"Status: {survey['status']}")
+    
+    print(f"\nInitial: S₈ = {S8_initial:.3f} ± {sigma:.3f}")
+    
+    for i, (z_eff, z_bin, correction) in enumerate(zip(survey['z_eff'], survey['z_bins'],
+                                                        result['bin_corrections'])):
+        print(f"\nBin {i+1}: z = {z_bin[0]:.1f}-{z_bin[1]:.1f} (z_eff = {z_eff:.2f})")
+        print(f"  ΔS₈ correction: +{correction:.3f}")
+    
+    print("\n" + BANNER)
     print(f"RESULTS: {survey_name}")
-    print(f"{'='*80}")
+    print(BANNER)
     print(f"Initial: S₈ = {S8_initial:.3f} ± {sigma:.3f}")
-    print(f"Final:   S₈ = {S8_final:.3f} ± {sigma:.3f}")
-    print(f"Correction: ΔS₈ = +{total_correction:.3f}")
+    print(f"Final:   S₈ = {result['S8_final']:.3f} ± {sigma:.3f}")
+    print(f"Correction: ΔS₈ = +{result['total_correction']:.3f}")
     print(f"\nTension with Planck (S₈ = {PLANCK_S8:.3f}):")
-    print(f"  Initial: {tension_initial:.2f}σ")
-    print(f"  Final:   {tension_final:.2f}σ")
-    print(f"  Reduction: {reduction:.1f}%")
-    print(f"\nEpistemic distance: ΔT = {delta_T:.3f} < 0.15 ✅")
+    print(f"  Initial: {result['tension_initial']:.2f}σ")
+    print(f"  Final:   {result['tension_final']:.2f}σ")
+    print(f"  Reduction: {result['reduction_percent']:.1f}%")
+    print(f"\nEpistemic distance: ΔT = {result['delta_T']:.3f} < 0.15 ✅")
+
+
+def apply_multiresolution_to_survey(survey_name: str, verbose: bool = True) -> Dict:
+    """
+    Apply multi-resolution correction to a survey using published S8.
+    
+    Args:
+        survey_name: 'KiDS-1000', 'DES-Y3', or 'HSC-Y3'
+        verbose: Print the per-survey report
+        
+    Returns:
+        dict: Results including corrected S8
+    """
+    result = _compute_survey(survey_name)
+    
+    if verbose:
+        _format_report(result)
     
     return {
-        'survey': survey_name,
-        'S8_initial': float(S8_initial),
-        'sigma': float(sigma),
-        'S8_final': float(S8_final),
-        'total_correction': float(total_correction),
-        'bin_corrections': [float(c) for c in corrections],
-        'z_eff': survey['z_eff'],
-        'tension_initial': float(tension_initial),
-        'tension_final': float(tension_final),
-        'reduction_percent': float(reduction),
-        'delta_T': float(delta_T),
-        'reference': survey['reference'],
-        'status': survey['status']
+        **result,
+        'bin_corrections': list(result['bin_corrections']),
+        'z_eff': list(result['z_eff']),
     }
 
 
@@ -160,26 +220,36 @@ def cross_survey_consistency_check(results: List[Dict]) -> Dict:
     Returns:
         dict: Consistency metrics
     """
-    print(f"\n{'='*80}")
+    print("\n" + BANNER)
     print("CROSS-SURVEY CONSISTENCY CHECK")
-    print(f"{'='*80}")
+    print(BANNER)
     
     # Compare corrections at similar redshifts
     print("\nBin-by-Bin Correction Comparison:")
     print(f"{'Survey':<12} {'z_eff':<8} {'ΔS₈':<8} {'Pattern'}")
     print("-" * 60)
     
-    for result in results:
-        for z, corr in zip(result['z_eff'], result['bin_corrections']):
-            print(f"{result['survey']:<12} {z:<8.2f} {corr:< 8.3f} {'Consistent' if 0.014 < corr < 0.019 else 'Check'}")
+    # z_eff and correction for every bin of every survey, one flat array each;
+    # each survey's bins are a contiguous block of rows
+    z_col = np.concatenate([np.asarray(result['z_eff'], dtype=np.float64) for result in results])
+    corr_col = np.concatenate([np.asarray(result['bin_corrections'], dtype=np.float64)
+                               for result in results])
+    consistent = (0.014 < corr_col) & (corr_col < 0.019)
     
-    # Calculate standard deviation of corrections
-    all_corrections = []
+    survey_rows = []
+    start = 0
     for result in results:
-        all_corrections.extend(result['bin_corrections'])
+        stop = start + len(result['z_eff'])
+        survey_rows.append((result['survey'], slice(start, stop)))
+        start = stop
     
-    mean_corr = np.mean(all_corrections)
-    std_corr = np.std(all_corrections)
+    for name, rows in survey_rows:
+        for z, corr, ok in zip(z_col[rows].tolist(), corr_col[rows].tolist(), consistent[rows].tolist()):
+            print(f"{name:<12} {z:<8.2f} {corr:< 8.3f} {'Consistent' if ok else 'Check'}")
+    
+    # Calculate standard deviation of corrections
+    mean_corr = corr_col.mean()
+    std_corr = corr_col.std()
     
     print(f"\nStatistical Consistency:")
     print(f"  Mean correction: {mean_corr:.3f}")
@@ -188,17 +258,14 @@ def cross_survey_consistency_check(results: List[Dict]) -> Dict:
     
     # Check redshift-dependent pattern
     print("\nRedshift Dependence:")
-    for result in results:
-        z_arr = np.array(result['z_eff'])
-        corr_arr = np.array(result['bin_corrections'])
-        
+    for name, rows in survey_rows:
         # Check if corrections decrease with z
-        slope = np.polyfit(z_arr, corr_arr, 1)[0]
-        print(f"  {result['survey']}: slope = {slope:.4f} (expected: negative)")
+        slope = _linear_slope(z_col[rows], corr_col[rows])
+        print(f"  {name}: slope = {slope:.4f} (expected: negative)")
     
     return {
-        'mean_correction': float(mean_corr),
-        'std_correction': float(std_corr),
+        'mean_correction': mean_corr,
+        'std_correction': std_corr,
         'consistency_pass': bool(std_corr < 0.003),
         'pattern': 'Corrections decrease with redshift as expected'
     }
@@ -214,20 +281,24 @@ def combined_analysis(results: List[Dict]) -> Dict:
     Returns:
         dict: Combined metrics
     """
-    print(f"\n{'='*80}")
+    print("\n" + BANNER)
     print("COMBINED MULTI-SURVEY RESULTS")
-    print(f"{'='*80}")
+    print(BANNER)
     
-    # Weighted average (by uncertainty)
-    weights = [1/r['sigma']**2 for r in results]
-    total_weight = sum(weights)
+    # Weighted average (by uncertainty), initial and final S8 together
+    n_surveys = len(results)
+    sigmas = np.fromiter((r['sigma'] for r in results), dtype=np.float64, count=n_surveys)
+    S8_values = np.empty((2, n_surveys))
+    S8_values[0] = np.fromiter((r['S8_initial'] for r in results), dtype=np.float64, count=n_surveys)
+    S8_values[1] = np.fromiter((r['S8_final'] for r in results), dtype=np.float64, count=n_surveys)
     
-    S8_initial_combined = sum(r['S8_initial'] * w for r, w in zip(results, weights)) / total_weight
-    S8_final_combined = sum(r['S8_final'] * w for r, w in zip(results, weights)) / total_weight
-    sigma_combined = 1 / np.sqrt(total_weight)
+    weights = 1 / sigmas**2
+    S8_initial_combined, S8_final_combined = np.average(S8_values, axis=1, weights=weights)
+    sigma_combined = 1 / np.sqrt(weights.sum())
     
-    tension_initial = abs(S8_initial_combined - PLANCK_S8) / np.sqrt(sigma_combined**2 + PLANCK_SIGMA**2)
-    tension_final = abs(S8_final_combined - PLANCK_S8) / np.sqrt(sigma_combined**2 + PLANCK_SIGMA**2)
+    tension_initial, tension_final = tensions_with_planck(
+        (S8_initial_combined, S8_final_combined), sigma_combined
+    )
     
     print(f"\nCombined (KiDS + DES + HSC):")
     print(f"  Initial: S₈ = {S8_initial_combined:.3f} ± {sigma_combined:.3f}")
@@ -238,11 +309,11 @@ def combined_analysis(results: List[Dict]) -> Dict:
     print(f"  Reduction: {(1 - tension_final/tension_initial)*100:.1f}%")
     
     return {
-        'S8_initial_combined': float(S8_initial_combined),
-        'S8_final_combined': float(S8_final_combined),
-        'sigma_combined': float(sigma_combined),
-        'tension_initial': float(tension_initial),
-        'tension_final': float(tension_final)
+        'S8_initial_combined': S8_initial_combined,
+        'S8_final_combined': S8_final_combined,
+        'sigma_combined': sigma_combined,
+        'tension_initial': tension_initial,
+        'tension_final': tension_final
     }
 
 
@@ -284,8 +355,7 @@ Status: Using published values (pending real correlation function data access)
         }
     }
     
-    with open('cross_survey_validation_results.json', 'w') as f:
-        json.dump(output, f, indent=2)
+    write_json('cross_survey_validation_results.json', output)
     
     print(f"\n✅ Results saved to: cross_survey_validation_results.json")
     
@@ -14,8 +14,11 @@ Status: Ready for testing
 """
 
 import numpy as np
-import json
-from typing import Dict, List, Tuple, Optional, Any
+import argparse
+import io
+from functools import lru_cache, partial
+import concurrent.futures as cf
+from typing import Dict, List, Tuple, Optional, Any, Callable, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import sys
@@ -23,6 +26,7 @@ from pathlib import Path
 
 # Import centralized constants (SSOT)
 from config.constants import PLANCK_H0, PLANCK_H0_SIGMA, SHOES_H0
+from utils.files import write_json
 
 # Import the multi-resolution engine
 sys.path.append(str(Path(__file__).parent))
@@ -34,8 +38,10 @@ try:
         UHAAddress,
         ObserverTensor
     )
+    ENCODER_AVAILABLE = True
 except ImportError:
     print("Warning: multiresolution_uha_encoder not found. Some tests will be skipped.")
+    ENCODER_AVAILABLE = False
 
 
 # ============================================================================
@@ -52,7 +58,25 @@ class TestStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Small integer code per status, so suite summaries are one np.bincount
+STATUS_ORDER = list(TestStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUS_ORDER)}
+
+# Statuses that stop a fail-fast run
+FAILING_STATUSES = (TestStatus.FAILED, TestStatus.ERROR)
+
+# Overall verdict by minimum pass rate (%), checked in order
+VALIDATION_VERDICTS = [
+    (80, "✅ VALIDATION SUCCESSFUL: Method passes acceptance criteria (≥80% tests)\n"
+         "   Status: PUBLICATION-READY"),
+    (60, "⚠️  PARTIAL VALIDATION: Method shows promise but needs improvement\n"
+         "   Status: REQUIRES FURTHER WORK"),
+    (0, "❌ VALIDATION FAILED: Method does not meet acceptance criteria\n"
+        "   Status: HYPOTHESIS CHALLENGED"),
+]
+
+
+@dataclass(frozen=True)
 class TestResult:
     """Result of a single test"""
     test_id: str
@@ -82,30 +106,50 @@ class TestSuite:
     """Collection of related tests"""
     suite_name: str
     tests: List[TestResult] = field(default_factory=list)
+    status_codes: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.status_codes = [STATUS_CODES[test.status] for test in self.tests]
 
     def add_result(self, result: TestResult):
         self.tests.append(result)
+        self.status_codes.append(STATUS_CODES[result.status])
+
+    def run_tests(self, tests: List[Callable[[], TestResult]], fail_fast: bool = False) -> 'TestSuite':
+        """Run test callables in order, stopping at the first failure if fail_fast"""
+        for test_fn in tests:
+            result = test_fn()
+            self.add_result(result)
+            if fail_fast and result.status in FAILING_STATUSES:
+                break
+        return self
+
+    def has_failures(self) -> bool:
+        return any(test.status in FAILING_STATUSES for test in self.tests)
 
     def get_summary(self) -> Dict[str, int]:
-        summary = {status.value: 0 for status in TestStatus}
-        for test in self.tests:
-            summary[test.status.value] += 1
-        return summary
+        counts = np.bincount(np.array(self.status_codes, dtype=np.uint8), minlength=len(STATUS_ORDER))
+        return {status.value: count for status, count in zip(STATUS_ORDER, counts.tolist())}
 
     def print_summary(self):
-        print(f"\n{'='*80}")
-        print(f"Test Suite: {self.suite_name}")
-        print(f"{'='*80}")
+        # Buffer the report and write it to stdout once
+        buf = io.StringIO()
+        print(f"\n{'='*80}", file=buf)
+        print(f"Test Suite: {self.suite_name}", file=buf)
+        print(f"{'='*80}", file=buf)
         summary = self.get_summary()
         total = len(self.tests)
         passed = summary['passed']
         failed = summary['failed']
-        print(f"Total Tests: {total}")
-        print(f"  ✓ Passed:  {passed} ({100*passed/total if total > 0 else 0:.1f}%)")
-        print(f"  ✗ Failed:  {failed} ({100*failed/total if total > 0 else 0:.1f}%)")
-        print(f"  ⊘ Skipped: {summary['skipped']}")
-        print(f"  ⚠ Error:   {summary['error']}")
-        print(f"{'='*80}\n")
+        print(f"Total Tests: {total}", file=buf)
+        print(f"  ✓ Passed:  {passed} ({100*passed/total if total > 0 else 0:.1f}%)", file=buf)
+        print(f"  ✗ Failed:  {failed} ({100*failed/total if total > 0 else 0:.1f}%)", file=buf)
+        print(f"  ⊘ Skipped: {summary['skipped']}", file=buf)
+        print(f"  ⚠ Error:   {summary['error']}", file=buf)
+        print(f"{'='*80}\n", file=buf)
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 # ============================================================================
@@ -114,7 +158,8 @@ class TestSuite:
 
 def generate_mock_planck_samples(n_samples: int = 5000,
                                  H0_true: float = None,
-                                 sigma_H0: float = None) -> np.ndarray:
+                                 sigma_H0: float = None,
+                                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate mock Planck CMB chain samples
 
@@ -122,6 +167,7 @@ def generate_mock_planck_samples(n_samples: int = 5000,
         n_samples: Number of samples to generate
         H0_true: True H0 value (defaults to PLANCK_H0)
         sigma_H0: H0 uncertainty (defaults to PLANCK_H0_SIGMA)
+        rng: Random generator (defaults to a fresh np.random.default_rng())
 
     Returns: Array of shape (n_samples, 4) with columns [H0, Omega_m, Omega_Lambda, sigma_8]
     """
@@ -129,19 +175,25 @@ def generate_mock_planck_samples(n_samples: int = 5000,
         H0_true = PLANCK_H0
     if sigma_H0 is None:
         sigma_H0 = PLANCK_H0_SIGMA
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # One draw for the random columns (H0, Omega_m, sigma_8), scaled/shifted in place
+    draws = rng.standard_normal((n_samples, 3))
+    draws *= (sigma_H0, 0.007, 0.006)
+    draws += (H0_true, 0.315, 0.811)
 
-    samples = np.zeros((n_samples, 4))
-    samples[:, 0] = np.random.normal(H0_true, sigma_H0, n_samples)  # H0
-    samples[:, 1] = np.random.normal(0.315, 0.007, n_samples)        # Omega_m
-    samples[:, 2] = 1.0 - samples[:, 1]                             # Omega_Lambda
-    samples[:, 3] = np.random.normal(0.811, 0.006, n_samples)        # sigma_8
+    samples = np.empty((n_samples, 4))
+    samples[:, [0, 1, 3]] = draws
+    np.subtract(1.0, samples[:, 1], out=samples[:, 2])  # Omega_Lambda
     return samples
 
 
 def generate_mock_shoes_samples(n_samples: int = 1000,
                                 H0_true: float = None,
                                 sigma_H0: float = 1.04,
-                                add_systematic: Optional[Dict] = None) -> np.ndarray:
+                                add_systematic: Optional[Dict] = None,
+                                rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate mock SH0ES distance ladder chain samples
 
@@ -150,32 +202,64 @@ def generate_mock_shoes_samples(n_samples: int = 1000,
         H0_true: True H0 value (defaults to SHOES_H0, before systematics)
         sigma_H0: Statistical uncertainty
         add_systematic: Dict with keys 'scale_mpc', 'bias_percent', 'systematic_type'
+        rng: Random generator (defaults to a fresh np.random.default_rng())
 
     Returns: Array of shape (n_samples, 4) with columns [H0, Omega_m, distance, redshift]
     """
     if H0_true is None:
         H0_true = SHOES_H0
+    if rng is None:
+        rng = np.random.default_rng()
 
-    samples = np.zeros((n_samples, 4))
+    # H0 and Omega_m from one normal draw
+    samples = np.empty((n_samples, 4))
+    samples[:, :2] = rng.standard_normal((n_samples, 2))
+    samples[:, :2] *= (sigma_H0, 0.02)               # Omega_m less constrained
+    samples[:, :2] += (H0_true, 0.30)
+    H0_base = samples[:, 0]
 
-    # Base H0 measurements
-    H0_base = np.random.normal(H0_true, sigma_H0, n_samples)
+    # Distance (Mpc), drawn once and shared with the systematic below
+    distances = samples[:, 2]
+    distances[:] = rng.uniform(10, 40, n_samples)
+    samples[:, 3] = distances * 70.0 / 3e5                           # Approximate redshift
 
     # Add systematic bias if specified
     if add_systematic is not None:
         scale_mpc = add_systematic.get('scale_mpc', 10.0)
         bias_percent = add_systematic.get('bias_percent', 0.0)
 
-        # Systematic varies with distance
-        distances = np.random.uniform(10, 40, n_samples)  # Mpc
+        # Systematic varies with the stored distance
         systematic_amplitude = bias_percent * np.exp(-distances / scale_mpc)
         H0_base *= (1.0 + systematic_amplitude / 100.0)
 
-    samples[:, 0] = H0_base
-    samples[:, 1] = np.random.normal(0.30, 0.02, n_samples)          # Omega_m (less constrained)
-    samples[:, 2] = np.random.uniform(10, 40, n_samples)             # Distance (Mpc)
-    samples[:, 3] = samples[:, 2] * 70.0 / 3e5                       # Approximate redshift
+    return samples
+
+
+# Seed for the shared mock samples used by the test categories
+MOCK_SEED = 42
 
+
+@lru_cache(maxsize=8)
+def cached_mock_planck_samples(n_samples: int, H0_true: float, seed: int = MOCK_SEED) -> np.ndarray:
+    """
+    Seeded mock Planck samples, memoized per (n_samples, H0_true, seed).
+
+    The array is shared between callers, so it is returned read-only.
+    """
+    samples = generate_mock_planck_samples(n_samples, H0_true, rng=np.random.default_rng((seed, 0)))
+    samples.flags.writeable = False
+    return samples
+
+
+@lru_cache(maxsize=8)
+def cached_mock_shoes_samples(n_samples: int, H0_true: float, seed: int = MOCK_SEED) -> np.ndarray:
+    """
+    Seeded mock SH0ES samples (no systematic), memoized per (n_samples, H0_true, seed).
+
+    The array is shared between callers, so it is returned read-only.
+    """
+    samples = generate_mock_shoes_samples(n_samples, H0_true, rng=np.random.default_rng((seed, 1)))
+    samples.flags.writeable = False
     return samples
 
 
@@ -195,16 +279,17 @@ def inject_multi_scale_systematics(samples: np.ndarray,
     """
     modified = samples.copy()
 
-    for systematic in systematic_config:
-        scale = systematic['scale_mpc']
-        bias = systematic['bias_percent']
+    scales = np.fromiter((systematic['scale_mpc'] for systematic in systematic_config),
+                         dtype=np.float64, count=len(systematic_config))
+    biases = np.fromiter((systematic['bias_percent'] for systematic in systematic_config),
+                         dtype=np.float64, count=len(systematic_config))
 
-        # Distance-dependent systematic
-        distances = samples[:, 2]
-        systematic_factor = bias * np.exp(-distances / scale) / 100.0
+    # Distance-dependent systematics, all scales at once: shape (n_samples, n_systematics)
+    distances = samples[:, 2, np.newaxis]
+    systematic_factor = biases * np.exp(-distances / scales) / 100.0
 
-        # Apply to H0
-        modified[:, 0] *= (1.0 + systematic_factor)
+    # Apply the combined factor to H0 in a single pass
+    modified[:, 0] *= np.prod(1.0 + systematic_factor, axis=1)
 
     return modified
 
@@ -313,11 +398,12 @@ class TestScaleMatchedAnchors:
                 error_message=str(e)
             )
 
-    def run_all(self) -> TestSuite:
+    def run_all(self, fail_fast: bool = False) -> TestSuite:
         """Run all tests in this category"""
-        self.suite.add_result(self.test_1a1_ngc4258_high_resolution())
-        self.suite.add_result(self.test_1a2_geometric_distance_consistency())
-        return self.suite
+        return self.suite.run_tests([
+            self.test_1a1_ngc4258_high_resolution,
+            self.test_1a2_geometric_distance_consistency,
+        ], fail_fast=fail_fast)
 
 
 # ============================================================================
@@ -327,8 +413,9 @@ class TestScaleMatchedAnchors:
 class TestResolutionMismatch:
     """Test suite for resolution mismatch detection"""
 
-    def __init__(self):
+    def __init__(self, use_engine: bool = False):
         self.suite = TestSuite("Resolution Mismatch Detection")
+        self.use_engine = use_engine
 
     def test_2a1_local_anchor_coarse_resolution(self) -> TestResult:
         """Test 2A.1: Local anchor incorrectly encoded at coarse resolution"""
@@ -337,7 +424,7 @@ class TestResolutionMismatch:
 
         try:
             # SH0ES local sample at WRONG resolution (too coarse)
-            shoes_samples = generate_mock_shoes_samples(n_samples=100)
+            shoes_samples = cached_mock_shoes_samples(n_samples=100, H0_true=SHOES_H0)
 
             # Encode at 8 bits (too coarse for local ~30 Mpc measurements)
             # This should produce artificially large ΔT
@@ -379,21 +466,50 @@ class TestResolutionMismatch:
         test_id = "2B.1"
         test_name = "Single-Resolution Convergence Failure"
 
-        try:
-            # Generate mock data with tension
-            planck_samples = generate_mock_planck_samples(n_samples=1000, H0_true=67.36)
-            shoes_samples = generate_mock_shoes_samples(n_samples=500, H0_true=73.04)
-
-            # Initial H0 difference
-            initial_delta_H0 = abs(np.mean(planck_samples[:, 0]) - np.mean(shoes_samples[:, 0]))
-
-            # Attempt "convergence" at single resolution (simplified simulation)
-            # In reality this would call iterative_tensor_refinement_multiresolution
-            # with resolution_schedule=[16]
+        if self.use_engine and not ENCODER_AVAILABLE:
+            return TestResult(
+                test_id=test_id,
+                test_name=test_name,
+                status=TestStatus.SKIPPED,
+                expected="No convergence",
+                actual="multiresolution_uha_encoder not available"
+            )
 
-            # For this test, we'll simulate: single resolution provides minimal improvement
-            simulated_improvement = 0.1  # Only 10% reduction in ΔH0
-            final_delta_H0 = initial_delta_H0 * (1.0 - simulated_improvement)
+        try:
+            if self.use_engine:
+                # Generate mock data with tension
+                planck_samples = cached_mock_planck_samples(n_samples=1000, H0_true=67.36)
+                shoes_samples = cached_mock_shoes_samples(n_samples=500, H0_true=73.04)
+
+                # Initial H0 difference
+                H0_planck = np.mean(planck_samples[:, 0])
+                initial_delta_H0 = abs(H0_planck - np.mean(shoes_samples[:, 0]))
+
+                # Attempt convergence at a single fixed resolution
+                tensors, history = iterative_tensor_refinement_multiresolution(
+                    chain_planck=planck_samples,
+                    chain_shoes=shoes_samples,
+                    cosmo_params_planck={'h0': H0_planck,
+                                         'omega_m': np.mean(planck_samples[:, 1]),
+                                         'omega_lambda': np.mean(planck_samples[:, 2])},
+                    cosmo_params_shoes={'h0': np.mean(shoes_samples[:, 0]),
+                                        'omega_m': np.mean(shoes_samples[:, 1]),
+                                        'omega_lambda': 1.0 - np.mean(shoes_samples[:, 1])},
+                    resolution_schedule=[16],
+                    convergence_threshold=0.15,
+                    max_iterations=50
+                )
+                final_tensor = tensors[-1]
+                final_delta_H0 = abs(final_tensor.get('H0', final_tensor.get('h0', H0_planck)) - H0_planck)
+                simulated_improvement = 1.0 - final_delta_H0 / initial_delta_H0
+            else:
+                # Closed form from the mock H0 centres: no sampling needed,
+                # the sample means only add noise around these values
+                initial_delta_H0 = abs(67.36 - 73.04)
+
+                # Single resolution provides minimal improvement
+                simulated_improvement = 0.1  # Only 10% reduction in ΔH0
+                final_delta_H0 = initial_delta_H0 * (1.0 - simulated_improvement)
 
             # Expected: ΔH0 remains large (> 3 km/s/Mpc)
             expected = "ΔH₀ > 3.0 km/s/Mpc (no convergence)"
@@ -424,11 +540,12 @@ class TestResolutionMismatch:
                 error_message=str(e)
             )
 
-    def run_all(self) -> TestSuite:
+    def run_all(self, fail_fast: bool = False) -> TestSuite:
         """Run all tests in this category"""
-        self.suite.add_result(self.test_2a1_local_anchor_coarse_resolution())
-        self.suite.add_result(self.test_2b1_single_resolution_failure())
-        return self.suite
+        return self.suite.run_tests([
+            self.test_2a1_local_anchor_coarse_resolution,
+            self.test_2b1_single_resolution_failure,
+        ], fail_fast=fail_fast)
 
 
 # ============================================================================
@@ -438,8 +555,9 @@ class TestResolutionMismatch:
 class TestSimulatedUniverse:
     """Test suite for simulated multi-scale systematic recovery"""
 
-    def __init__(self):
+    def __init__(self, seed: int = MOCK_SEED):
         self.suite = TestSuite("Simulated Multi-Scale Universe")
+        self.rng = np.random.default_rng(seed)
 
     def test_3a1_three_scale_systematic_recovery(self) -> TestResult:
         """Test 3A.1: Recovery of injected three-scale systematics"""
@@ -458,8 +576,8 @@ class TestSimulatedUniverse:
             ]
 
             # Generate mock with systematics
-            planck_samples = generate_mock_planck_samples(n_samples=1000, H0_true=H0_true)
-            shoes_samples_clean = generate_mock_shoes_samples(n_samples=500, H0_true=H0_true)
+            planck_samples = cached_mock_planck_samples(n_samples=1000, H0_true=H0_true)
+            shoes_samples_clean = cached_mock_shoes_samples(n_samples=500, H0_true=H0_true)
             shoes_samples_biased = inject_multi_scale_systematics(
                 shoes_samples_clean, systematic_config
             )
@@ -477,7 +595,7 @@ class TestSimulatedUniverse:
             # Result should recover H0_true within 0.5 km/s/Mpc
 
             # Simulate recovery
-            H0_recovered = H0_true + np.random.normal(0, 0.3)  # Within uncertainties
+            H0_recovered = H0_true + self.rng.normal(0, 0.3)  # Within uncertainties
 
             recovery_error = abs(H0_recovered - H0_true)
 
@@ -522,8 +640,8 @@ class TestSimulatedUniverse:
             H0_ede_boost = 1.09  # EDE increases H0 by 9%
             H0_shoes_ede = H0_planck * H0_ede_boost
 
-            planck_samples = generate_mock_planck_samples(n_samples=1000, H0_true=H0_planck)
-            shoes_samples = generate_mock_shoes_samples(n_samples=500, H0_true=H0_shoes_ede)
+            planck_samples = cached_mock_planck_samples(n_samples=1000, H0_true=H0_planck)
+            shoes_samples = cached_mock_shoes_samples(n_samples=500, H0_true=H0_shoes_ede)
 
             # Multi-resolution refinement should NOT converge (EDE is not spatial)
             # Simulated: ΔT remains high
@@ -561,11 +679,12 @@ class TestSimulatedUniverse:
                 error_message=str(e)
             )
 
-    def run_all(self) -> TestSuite:
+    def run_all(self, fail_fast: bool = False) -> TestSuite:
         """Run all tests in this category"""
-        self.suite.add_result(self.test_3a1_three_scale_systematic_recovery())
-        self.suite.add_result(self.test_3b1_early_dark_energy_failure())
-        return self.suite
+        return self.suite.run_tests([
+            self.test_3a1_three_scale_systematic_recovery,
+            self.test_3b1_early_dark_energy_failure,
+        ], fail_fast=fail_fast)
 
 
 # ============================================================================
@@ -575,8 +694,9 @@ class TestSimulatedUniverse:
 class TestResolutionSchedule:
     """Test suite for resolution schedule robustness"""
 
-    def __init__(self):
+    def __init__(self, seed: int = MOCK_SEED):
         self.suite = TestSuite("Resolution Schedule Optimization")
+        self.rng = np.random.default_rng(seed)
 
     def test_5a1_schedule_variation(self) -> TestResult:
         """Test 5A.1: Final H0 independent of schedule details"""
@@ -593,14 +713,12 @@ class TestResolutionSchedule:
 
             # Simulate: Each schedule converges to similar H0
             H0_true = 68.5
-            H0_results = {}
-            for name, schedule in schedules.items():
-                # Add small random variation (simulating numerical differences)
-                H0_results[name] = H0_true + np.random.normal(0, 0.2)
+            # Add small random variation (simulating numerical differences)
+            H0_values = H0_true + self.rng.normal(0, 0.2, size=len(schedules))
+            H0_results = dict(zip(schedules, H0_values.tolist()))
 
             # Compute range
-            H0_values = list(H0_results.values())
-            H0_range = max(H0_values) - min(H0_values)
+            H0_range = float(np.ptp(H0_values))
 
             # Expected: Range < 0.5 km/s/Mpc
             expected = "H₀ range < 0.5 km/s/Mpc across schedules"
@@ -672,11 +790,12 @@ class TestResolutionSchedule:
                 error_message=str(e)
             )
 
-    def run_all(self) -> TestSuite:
+    def run_all(self, fail_fast: bool = False) -> TestSuite:
         """Run all tests in this category"""
-        self.suite.add_result(self.test_5a1_schedule_variation())
-        self.suite.add_result(self.test_5b1_skip_critical_scale())
-        return self.suite
+        return self.suite.run_tests([
+            self.test_5a1_schedule_variation,
+            self.test_5b1_skip_critical_scale,
+        ], fail_fast=fail_fast)
 
 
 # ============================================================================
@@ -686,8 +805,9 @@ class TestResolutionSchedule:
 class TestRobustness:
     """Test suite for statistical robustness"""
 
-    def __init__(self):
+    def __init__(self, seed: int = MOCK_SEED):
         self.suite = TestSuite("Robustness & Sensitivity")
+        self.rng = np.random.default_rng(seed)
 
     def test_8a1_bootstrap_resampling(self) -> TestResult:
         """Test 8A.1: Bootstrap stability of H0 result"""
@@ -696,25 +816,16 @@ class TestRobustness:
 
         try:
             # Generate base samples
-            planck_samples = generate_mock_planck_samples(n_samples=2000, H0_true=67.36)
-            shoes_samples = generate_mock_shoes_samples(n_samples=800, H0_true=73.04)
+            planck_samples = cached_mock_planck_samples(n_samples=2000, H0_true=67.36)
+            shoes_samples = cached_mock_shoes_samples(n_samples=800, H0_true=73.04)
 
             # Bootstrap resampling
             n_bootstrap = 100  # Reduced for speed (full test would use 1000)
-            bootstrap_H0 = []
+            rng = self.rng
 
-            for i in range(n_bootstrap):
-                # Resample with replacement
-                idx_planck = np.random.choice(len(planck_samples), len(planck_samples), replace=True)
-                idx_shoes = np.random.choice(len(shoes_samples), len(shoes_samples), replace=True)
-
-                boot_planck = planck_samples[idx_planck]
-                boot_shoes = shoes_samples[idx_shoes]
-
-                # Simulate multi-resolution result (would call actual function)
-                # Expected convergence to ~68.5 km/s/Mpc
-                H0_boot = 68.5 + np.random.normal(0, 1.3)  # Simulate with expected uncertainty
-                bootstrap_H0.append(H0_boot)
+            # Simulate multi-resolution result (would call actual function per resample)
+            # Expected convergence to ~68.5 km/s/Mpc
+            bootstrap_H0 = 68.5 + rng.normal(0, 1.3, size=n_bootstrap)  # Simulate with expected uncertainty
 
             # Statistical analysis
             H0_mean = np.mean(bootstrap_H0)
@@ -767,11 +878,11 @@ class TestRobustness:
 
             # Simulate: H0 converges to similar value regardless of threshold
             H0_true = 68.5
-            H0_results = {thresh: H0_true + np.random.normal(0, 0.15) for thresh in thresholds}
+            H0_values = H0_true + self.rng.normal(0, 0.15, size=len(thresholds))
+            H0_results = dict(zip(thresholds, H0_values.tolist()))
 
             # Compute range
-            H0_values = list(H0_results.values())
-            H0_range = max(H0_values) - min(H0_values)
+            H0_range = float(np.ptp(H0_values))
 
             # Expected: Range < 0.5 km/s/Mpc
             expected = "H₀ range < 0.5 km/s/Mpc across thresholds"
@@ -798,95 +909,125 @@ class TestRobustness:
                 error_message=str(e)
             )
 
-    def run_all(self) -> TestSuite:
+    def run_all(self, fail_fast: bool = False) -> TestSuite:
         """Run all tests in this category"""
-        self.suite.add_result(self.test_8a1_bootstrap_resampling())
-        self.suite.add_result(self.test_8b1_convergence_threshold_sensitivity())
-        return self.suite
+        return self.suite.run_tests([
+            self.test_8a1_bootstrap_resampling,
+            self.test_8b1_convergence_threshold_sensitivity,
+        ], fail_fast=fail_fast)
 
 
 # ============================================================================
 # Master Test Runner
 # ============================================================================
 
+def _run_suite(factory: Callable[[], Any], fail_fast: bool = False) -> TestSuite:
+    """Build a test suite and run it (module-level so worker processes can unpickle it)"""
+    return factory().run_all(fail_fast=fail_fast)
+
+
 class ValidationTestRunner:
     """Master test runner for all validation categories"""
 
-    def __init__(self):
+    def __init__(self, use_engine: bool = False):
         self.test_suites = []
         self.results_file = Path(__file__).parent / "test_results.json"
-
-    def run_all_tests(self) -> List[TestSuite]:
-        """Run all validation test suites"""
+        self.use_engine = use_engine
+
+    def suite_factories(self) -> List[Tuple[str, str, Callable[[], Any]]]:
+        """(category, description, factory) for every test suite, in run order
+
+        Factories are classes or partials so they pickle for worker processes.
+        """
+        return [
+            ('1', 'Scale-Matched Independent Anchors', TestScaleMatchedAnchors),
+            ('2', 'Resolution Mismatch Detection',
+             partial(TestResolutionMismatch, use_engine=self.use_engine)),
+            ('3', 'Simulated Multi-Scale Universe', TestSimulatedUniverse),
+            ('5', 'Resolution Schedule Optimization', TestResolutionSchedule),
+            ('8', 'Robustness & Sensitivity', TestRobustness),
+        ]
+
+    def run_all_tests(self, categories: Optional[Set[str]] = None,
+                      max_workers: int = 1, fail_fast: bool = False) -> List[TestSuite]:
+        """Run all validation test suites, or only the selected categories
+
+        Suites are instantiated right before they run, so unselected
+        categories never build their test fixtures. The suites share no
+        state, so with max_workers > 1 they run in a process pool; results
+        are collected and summarized in category order either way. With
+        fail_fast, each suite stops at its first failed/errored test and no
+        further suites are run (pending pool jobs are cancelled).
+        """
         print("\n" + "="*80)
         print("Multi-Resolution Hubble Tension Validation Test Battery")
         print("="*80 + "\n")
 
-        # Category 1: Scale-Matched Anchors
-        print("Running Category 1: Scale-Matched Independent Anchors...")
-        suite1 = TestScaleMatchedAnchors().run_all()
-        self.test_suites.append(suite1)
-        suite1.print_summary()
-
-        # Category 2: Resolution Mismatch
-        print("Running Category 2: Resolution Mismatch Detection...")
-        suite2 = TestResolutionMismatch().run_all()
-        self.test_suites.append(suite2)
-        suite2.print_summary()
-
-        # Category 3: Simulated Universe
-        print("Running Category 3: Simulated Multi-Scale Universe...")
-        suite3 = TestSimulatedUniverse().run_all()
-        self.test_suites.append(suite3)
-        suite3.print_summary()
-
-        # Category 5: Resolution Schedule
-        print("Running Category 5: Resolution Schedule Optimization...")
-        suite5 = TestResolutionSchedule().run_all()
-        self.test_suites.append(suite5)
-        suite5.print_summary()
-
-        # Category 8: Robustness
-        print("Running Category 8: Robustness & Sensitivity...")
-        suite8 = TestRobustness().run_all()
-        self.test_suites.append(suite8)
-        suite8.print_summary()
+        selected = [(category, description, factory)
+                    for category, description, factory in self.suite_factories()
+                    if categories is None or category in categories]
+
+        if max_workers > 1 and len(selected) > 1:
+            with cf.ProcessPoolExecutor(max_workers=min(max_workers, len(selected))) as ex:
+                futures = [ex.submit(_run_suite, factory, fail_fast) for _, _, factory in selected]
+                suites = []
+                for future in futures:
+                    suites.append(future.result())
+                    if fail_fast and suites[-1].has_failures():
+                        for pending in futures[len(suites):]:
+                            pending.cancel()
+                        break
+            selected = selected[:len(suites)]
+        else:
+            suites = None
+
+        for i, (category, description, factory) in enumerate(selected):
+            print(f"Running Category {category}: {description}...")
+            suite = suites[i] if suites is not None else _run_suite(factory, fail_fast)
+            self.test_suites.append(suite)
+            suite.print_summary()
+            if fail_fast and suite.has_failures():
+                break
 
         return self.test_suites
 
     def print_overall_summary(self):
         """Print summary across all test suites"""
-        print("\n" + "="*80)
-        print("OVERALL VALIDATION SUMMARY")
-        print("="*80)
-
-        total_tests = sum(len(suite.tests) for suite in self.test_suites)
-        total_passed = sum(suite.get_summary()['passed'] for suite in self.test_suites)
-        total_failed = sum(suite.get_summary()['failed'] for suite in self.test_suites)
-        total_skipped = sum(suite.get_summary()['skipped'] for suite in self.test_suites)
-        total_error = sum(suite.get_summary()['error'] for suite in self.test_suites)
+        buf = io.StringIO()
+        print("\n" + "="*80, file=buf)
+        print("OVERALL VALIDATION SUMMARY", file=buf)
+        print("="*80, file=buf)
+
+        # One pass over the suites, one summary per suite
+        total_tests = 0
+        totals = {'passed': 0, 'failed': 0, 'skipped': 0, 'error': 0}
+        for suite in self.test_suites:
+            summary = suite.get_summary()
+            total_tests += len(suite.tests)
+            for status in totals:
+                totals[status] += summary[status]
+        total_passed = totals['passed']
+        total_failed = totals['failed']
+        total_skipped = totals['skipped']
+        total_error = totals['error']
 
         pass_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
 
-        print(f"\nTotal Test Suites: {len(self.test_suites)}")
-        print(f"Total Tests: {total_tests}")
-        print(f"\n  ✓ Passed:  {total_passed} ({pass_rate:.1f}%)")
-        print(f"  ✗ Failed:  {total_failed}")
-        print(f"  ⊘ Skipped: {total_skipped}")
-        print(f"  ⚠ Error:   {total_error}")
-
-        print("\n" + "-"*80)
-        if pass_rate >= 80:
-            print("✅ VALIDATION SUCCESSFUL: Method passes acceptance criteria (≥80% tests)")
-            print("   Status: PUBLICATION-READY")
-        elif pass_rate >= 60:
-            print("⚠️  PARTIAL VALIDATION: Method shows promise but needs improvement")
-            print("   Status: REQUIRES FURTHER WORK")
-        else:
-            print("❌ VALIDATION FAILED: Method does not meet acceptance criteria")
-            print("   Status: HYPOTHESIS CHALLENGED")
+        print(f"\nTotal Test Suites: {len(self.test_suites)}", file=buf)
+        print(f"Total Tests: {total_tests}", file=buf)
+        print(f"\n  ✓ Passed:  {total_passed} ({pass_rate:.1f}%)", file=buf)
+        print(f"  ✗ Failed:  {total_failed}", file=buf)
+        print(f"  ⊘ Skipped: {total_skipped}", file=buf)
+        print(f"  ⚠ Error:   {total_error}", file=buf)
 
-        print("="*80 + "\n")
+        print("\n" + "-"*80, file=buf)
+        print(next(message for threshold, message in VALIDATION_VERDICTS
+                   if pass_rate >= threshold), file=buf)
+
+        print("="*80 + "\n", file=buf)
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def save_results(self):
         """Save test results to JSON file"""
@@ -903,8 +1044,7 @@ class ValidationTestRunner:
             }
             results['test_suites'].append(suite_data)
 
-        with open(self.results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        write_json(self.results_file, results)
 
         print(f"Results saved to: {self.results_file}")
 
@@ -915,8 +1055,21 @@ class ValidationTestRunner:
 
 def main():
     """Main entry point for test execution"""
-    runner = ValidationTestRunner()
-    runner.run_all_tests()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--engine', action='store_true',
+                        help='Run the multi-resolution engine where tests support it '
+                             '(default: closed-form simulation)')
+    parser.add_argument('--category', action='append', choices=['1', '2', '3', '5', '8'],
+                        help='Run only this test category (repeatable; default: all)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Run test suites in this many worker processes (default: 1, serial)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop at the first failed or errored test')
+    args = parser.parse_args()
+
+    runner = ValidationTestRunner(use_engine=args.engine)
+    runner.run_all_tests(categories=set(args.category) if args.category else None,
+                         max_workers=args.jobs, fail_fast=args.fail_fast)
     runner.print_overall_summary()
     runner.save_results()
 
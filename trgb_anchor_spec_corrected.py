@@ -12,11 +12,13 @@ Date: 2025-10-30
 """
 
 import numpy as np
-import json
 import math
+import sys
+from functools import lru_cache
 
 # Import centralized constants (SSOT)
 from config.constants import HORIZON_SIZE_TODAY_MPC
+from utils.files import dumps_json
 
 # UHA Specification Constants
 R_H_TODAY = HORIZON_SIZE_TODAY_MPC  # Mpc, horizon size at a ≈ 1
@@ -41,6 +43,13 @@ def calculate_resolution_bits(scale_mpc: float, horizon_mpc: float = None) -> di
     if horizon_mpc is None:
         horizon_mpc = R_H_TODAY
 
+    # Tables revisit the same scales; copy so callers can't alter the cache
+    return dict(_resolution_bits(scale_mpc, horizon_mpc))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _resolution_bits(scale_mpc: float, horizon_mpc: float) -> dict:
+    """Cached resolution analysis behind calculate_resolution_bits"""
     # Target cell size: ~1/20 of measurement scale
     delta_r_target = scale_mpc / 20.0
 
@@ -106,9 +115,12 @@ def validate_trgb_resolution():
     print()
 
     # Table of resolutions
-    print("Resolution Table (R_H = 14,000 Mpc):")
-    print(f"{'N (bits)':>8} {'Δr (Mpc)':>12} {'Δr (kpc)':>12} {'Ratio':>10} {'Assessment':>20}")
-    print("-" * 80)
+    # Build the whole table and write it once
+    lines = [
+        "Resolution Table (R_H = 14,000 Mpc):",
+        f"{'N (bits)':>8} {'Δr (Mpc)':>12} {'Δr (kpc)':>12} {'Ratio':>10} {'Assessment':>20}",
+        "-" * 80,
+    ]
 
     for N in [10, 11, 12, 13, 14, 15, 16, 20, 22]:
         delta_r = R_H_TODAY / (2 ** N)
@@ -126,9 +138,9 @@ def validate_trgb_resolution():
         else:
             assessment = "Over-resolved"
 
-        print(f"{N:8d} {delta_r:12.3f} {delta_r_kpc:12.1f} {ratio:10.4f} {assessment:>20}")
+        lines.append(f"{N:8d} {delta_r:12.3f} {delta_r_kpc:12.1f} {ratio:10.4f} {assessment:>20}")
 
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
     print("="*80 + "\n")
 
     return result
@@ -192,18 +204,20 @@ def resolver_function():
         ("Planck CMB", 14000, "Horizon scale")
     ]
 
-    print("Examples:")
-    print(f"{'Anchor':>20} {'Scale (Mpc)':>15} {'N (bits)':>10} {'Δr (Mpc)':>12} {'Domain':>20}")
-    print("-" * 80)
+    lines = [
+        "Examples:",
+        f"{'Anchor':>20} {'Scale (Mpc)':>15} {'N (bits)':>10} {'Δr (Mpc)':>12} {'Domain':>20}",
+        "-" * 80,
+    ]
 
     for name, scale, domain in examples:
-        delta_r_target = scale / 20.0
-        N = math.ceil(math.log2(R_H_TODAY / delta_r_target))
-        delta_r_actual = R_H_TODAY / (2 ** N)
+        resolution = calculate_resolution_bits(scale, R_H_TODAY)
+        N = resolution['N_bits']
+        delta_r_actual = resolution['delta_r_actual_mpc']
 
-        print(f"{name:>20} {scale:15.2f} {N:10d} {delta_r_actual:12.3f} {domain:>20}")
+        lines.append(f"{name:>20} {scale:15.2f} {N:10d} {delta_r_actual:12.3f} {domain:>20}")
 
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
     print("="*80 + "\n")
 
 
@@ -216,17 +230,20 @@ def main():
     # Generate corrected JSON
     trgb_json = generate_corrected_trgb_json()
 
+    # Serialize once for both the file and the printout
+    trgb_json_bytes = dumps_json(trgb_json)
+
     # Save to file
     output_file = "/root/private_multiresolution/trgb_anchor_spec_corrected.json"
-    with open(output_file, 'w') as f:
-        json.dump(trgb_json, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(trgb_json_bytes)
 
     print(f"Corrected TRGB anchor specification saved to:")
     print(f"  {output_file}")
     print()
 
     print("JSON:")
-    print(json.dumps(trgb_json, indent=2))
+    print(trgb_json_bytes.decode())
     print()
 
     # Show resolver function
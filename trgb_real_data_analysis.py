@@ -17,7 +17,7 @@ import numpy as np
 import json
 import requests
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import sys
 
 # Add multiresolution encoder to path
@@ -65,6 +65,12 @@ TRGB_GALAXIES = [
     ("NGC 1404", 20.2, 1.2, 54.675, -35.593),
 ]
 
+# TRGB_GALAXIES as a column-oriented structured array, for vectorized use
+TRGB_GALAXY_TABLE = np.array(TRGB_GALAXIES, dtype=[
+    ('name', 'U16'), ('dist', 'f8'), ('sigma', 'f8'), ('ra', 'f8'), ('dec', 'f8'),
+])
+TRGB_GALAXY_TABLE.flags.writeable = False
+
 # Planck 2018 parameters for comparison
 PLANCK_PARAMS = {
     'H0': PLANCK_H0,
@@ -81,6 +87,9 @@ TRGB_SIGMA_PUBLISHED = 1.9
 TRGB_H0_PREDICTED = 68.5
 TRGB_SIGMA_PREDICTED = 1.5
 
+# Seed for the mock chains, so repeated analysis runs are reproducible
+MOCK_SEED = 42
+
 
 # ============================================================================
 # Data Preparation
@@ -106,57 +115,63 @@ def calculate_trgb_h0(distance_mpc: float, sigma_distance: float,
     return H0, sigma_H0
 
 
-def prepare_trgb_mock_chains(n_samples: int = 5000) -> Tuple[np.ndarray, np.ndarray]:
+def prepare_trgb_mock_chains(n_samples: int = 5000,
+                             rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
     """
     Prepare mock MCMC chains for TRGB and Planck measurements.
 
     For TRGB: Sample from distance measurements to create H0 distribution
     For Planck: Use Gaussian around published values
 
+    Args:
+        n_samples: Number of samples per chain
+        rng: Random generator (defaults to a fresh np.random.default_rng())
+
     Returns:
         (trgb_chain, planck_chain) - Arrays of shape (n_samples, 4)
         Columns: [H0, Omega_m, Omega_lambda, sigma_8]
     """
-    # Planck chain (Gaussian sampling)
-    planck_chain = np.zeros((n_samples, 4))
-    planck_chain[:, 0] = np.random.normal(PLANCK_PARAMS['H0'],
-                                         PLANCK_PARAMS['sigma_H0'], n_samples)
-    planck_chain[:, 1] = np.random.normal(PLANCK_PARAMS['Omega_m'], 0.007, n_samples)
-    planck_chain[:, 2] = 1.0 - planck_chain[:, 1]
-    planck_chain[:, 3] = np.random.normal(0.811, 0.006, n_samples)
-
-    # TRGB chain: Sample from individual galaxy measurements
-    trgb_H0_samples = []
-
-    for galaxy_name, dist, sigma_dist, ra, dec in TRGB_GALAXIES:
-        # For each galaxy, sample distance
-        n_per_galaxy = n_samples // len(TRGB_GALAXIES)
+    if rng is None:
+        rng = np.random.default_rng()
 
-        # Sample distances
-        distances = np.random.normal(dist, sigma_dist, n_per_galaxy)
+    # Planck chain (Gaussian sampling): one draw for the random columns
+    # (H0, Omega_m, sigma_8), scaled/shifted in place
+    draws = rng.standard_normal((n_samples, 3))
+    draws *= (PLANCK_PARAMS['sigma_H0'], 0.007, 0.006)
+    draws += (PLANCK_PARAMS['H0'], PLANCK_PARAMS['Omega_m'], 0.811)
 
-        # Estimate velocities (simplified - using Hubble flow)
-        # In real analysis, would use flow model (CF4, 2M++)
-        velocities = TRGB_H0_PUBLISHED * distances + np.random.normal(0, 50, n_per_galaxy)
+    planck_chain = np.empty((n_samples, 4))
+    planck_chain[:, [0, 1, 3]] = draws
+    np.subtract(1.0, planck_chain[:, 1], out=planck_chain[:, 2])     # Omega_lambda
 
-        # Calculate H0 for each sample
-        H0_samples = velocities / distances
+    # TRGB chain: Sample from individual galaxy measurements,
+    # one row of distances per galaxy
+    n_per_galaxy = n_samples // len(TRGB_GALAXY_TABLE)
+    shape = (len(TRGB_GALAXY_TABLE), n_per_galaxy)
+    distances = rng.normal(TRGB_GALAXY_TABLE['dist'][:, None],
+                           TRGB_GALAXY_TABLE['sigma'][:, None], shape)
 
-        trgb_H0_samples.extend(H0_samples)
+    # Estimate velocities (simplified - using Hubble flow)
+    # In real analysis, would use flow model (CF4, 2M++)
+    velocities = TRGB_H0_PUBLISHED * distances + rng.normal(0, 50, shape)
 
-    # Convert to chain format
-    trgb_H0_samples = np.array(trgb_H0_samples)
+    # Calculate H0 for each sample
+    trgb_H0_samples = (velocities / distances).ravel()
 
     # Resample to exact n_samples if needed
     if len(trgb_H0_samples) != n_samples:
-        indices = np.random.choice(len(trgb_H0_samples), n_samples, replace=True)
+        indices = rng.integers(0, len(trgb_H0_samples), size=n_samples, dtype=np.int64)
         trgb_H0_samples = trgb_H0_samples[indices]
 
-    trgb_chain = np.zeros((n_samples, 4))
+    # Only Omega_m (less constrained) and sigma_8 need noise
+    draws = rng.standard_normal((n_samples, 2))
+    draws *= (0.02, 0.02)
+    draws += (0.30, 0.80)
+
+    trgb_chain = np.empty((n_samples, 4))
     trgb_chain[:, 0] = trgb_H0_samples
-    trgb_chain[:, 1] = np.random.normal(0.30, 0.02, n_samples)  # Less constrained
-    trgb_chain[:, 2] = 1.0 - trgb_chain[:, 1]
-    trgb_chain[:, 3] = np.random.normal(0.80, 0.02, n_samples)
+    trgb_chain[:, 1::2] = draws
+    np.subtract(1.0, trgb_chain[:, 1], out=trgb_chain[:, 2])
 
     return trgb_chain, planck_chain
 
@@ -173,22 +188,25 @@ def create_trgb_samples_with_positions() -> List[Dict]:
     - H0: Individual H0 estimate
     - sigma_H0: H0 uncertainty
     """
-    samples = []
+    # calculate_trgb_h0 is elementwise, so evaluate it on whole columns
+    H0, sigma_H0 = calculate_trgb_h0(TRGB_GALAXY_TABLE['dist'], TRGB_GALAXY_TABLE['sigma'])
 
-    for galaxy_name, dist, sigma_dist, ra, dec in TRGB_GALAXIES:
-        H0, sigma_H0 = calculate_trgb_h0(dist, sigma_dist)
+    columns = zip(TRGB_GALAXY_TABLE['name'].tolist(), TRGB_GALAXY_TABLE['ra'].tolist(),
+                  TRGB_GALAXY_TABLE['dec'].tolist(), TRGB_GALAXY_TABLE['dist'].tolist(),
+                  TRGB_GALAXY_TABLE['sigma'].tolist(), H0.tolist(), sigma_H0.tolist())
 
-        samples.append({
+    return [
+        {
             'name': galaxy_name,
             'ra_deg': ra,
             'dec_deg': dec,
             'distance_mpc': dist,
             'sigma_distance': sigma_dist,
-            'H0': H0,
-            'sigma_H0': sigma_H0,
-        })
-
-    return samples
+            'H0': H0_galaxy,
+            'sigma_H0': sigma_H0_galaxy,
+        }
+        for galaxy_name, ra, dec, dist, sigma_dist, H0_galaxy, sigma_H0_galaxy in columns
+    ]
 
 
 # ============================================================================
@@ -209,17 +227,24 @@ def run_trgb_multiresolution_analysis():
 
     # Prepare data
     print("Preparing TRGB and Planck MCMC chains...")
-    trgb_chain, planck_chain = prepare_trgb_mock_chains(n_samples=5000)
+    trgb_chain, planck_chain = prepare_trgb_mock_chains(n_samples=5000,
+                                                        rng=np.random.default_rng(MOCK_SEED))
+
+    # Chain H0 statistics, computed once
+    trgb_H0_mean = trgb_chain[:, 0].mean()
+    trgb_H0_std = trgb_chain[:, 0].std()
+    planck_H0_mean = planck_chain[:, 0].mean()
+    planck_H0_std = planck_chain[:, 0].std()
 
     print(f"TRGB chain: {len(trgb_chain)} samples")
-    print(f"  H0 = {np.mean(trgb_chain[:, 0]):.2f} ± {np.std(trgb_chain[:, 0]):.2f} km/s/Mpc")
+    print(f"  H0 = {trgb_H0_mean:.2f} ± {trgb_H0_std:.2f} km/s/Mpc")
 
     print(f"Planck chain: {len(planck_chain)} samples")
-    print(f"  H0 = {np.mean(planck_chain[:, 0]):.2f} ± {np.std(planck_chain[:, 0]):.2f} km/s/Mpc")
+    print(f"  H0 = {planck_H0_mean:.2f} ± {planck_H0_std:.2f} km/s/Mpc")
 
     # Initial tension
-    delta_H0_initial = np.mean(trgb_chain[:, 0]) - np.mean(planck_chain[:, 0])
-    sigma_combined = np.sqrt(np.std(trgb_chain[:, 0])**2 + np.std(planck_chain[:, 0])**2)
+    delta_H0_initial = trgb_H0_mean - planck_H0_mean
+    sigma_combined = np.sqrt(trgb_H0_std**2 + planck_H0_std**2)
     tension_initial = delta_H0_initial / sigma_combined
 
     print(f"\nInitial Tension:")
@@ -239,9 +264,9 @@ def run_trgb_multiresolution_analysis():
 
     # Cosmological parameters
     cosmo_trgb = {
-        'h0': np.mean(trgb_chain[:, 0]),
-        'omega_m': np.mean(trgb_chain[:, 1]),
-        'omega_lambda': np.mean(trgb_chain[:, 2])
+        'h0': trgb_H0_mean,
+        'omega_m': trgb_chain[:, 1].mean(),
+        'omega_lambda': trgb_chain[:, 2].mean()
     }
 
     cosmo_planck = {
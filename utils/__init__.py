@@ -8,10 +8,14 @@ validation, and corrections that were previously duplicated across multiple file
 from .cosmology import *
 from .validation import *
 from .corrections import *
+from .files import *
+from .reporting import *
 
 __all__ = [
     # Re-export all utility modules
     'cosmology',
     'validation',
     'corrections',
+    'files',
+    'reporting',
 ]
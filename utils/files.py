@@ -0,0 +1,71 @@
+"""
+Data File Utilities
+===================
+
+Centralized helpers for locating survey data files and saving results.
+Consolidates directory scanning and JSON writing previously duplicated
+across the parsers and analysis scripts.
+
+Author: Eric D. Martin
+Date: 2025-10-30
+License: MIT
+"""
+
+import json
+import os
+from typing import Any, Set
+
+# Optional: orjson serializes results (including NumPy scalars) faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def list_data_files(data_dir: str) -> Set[str]:
+    """
+    List file names in a data directory with a single directory scan.
+
+    Args:
+        data_dir: Directory to scan
+
+    Returns:
+        Set of regular-file names (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(data_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize results to indented, UTF-8 encoded JSON.
+
+    Uses orjson when it is installed. The json fallback is configured to
+    match it: non-ASCII characters are written as-is rather than escaped.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(filepath, data: Any) -> None:
+    """
+    Save results as indented JSON (see dumps_json).
+
+    Args:
+        filepath: Output path (str or Path)
+        data: JSON-serializable object
+    """
+    with open(filepath, 'wb') as f:
+        f.write(dumps_json(data))
@@ -0,0 +1,46 @@
+"""
+Console Reporting Utilities
+===========================
+
+Centralized environment switches and report printing for the analysis
+scripts. Consolidates verbosity handling previously duplicated across files.
+
+Author: Eric D. Martin
+Date: 2025-10-30
+License: MIT
+"""
+
+import os
+from typing import Callable
+
+
+def env_flag(name: str) -> bool:
+    """
+    Read an on/off switch from the environment.
+
+    Follows the survey parsers' convention (KIDS_VERBOSE, DES_VERBOSE,
+    HSC_VERBOSE): any non-empty value turns the switch on.
+
+    Args:
+        name: Environment variable name
+
+    Returns:
+        True if the variable is set to a non-empty value
+    """
+    return bool(os.environ.get(name))
+
+
+def make_reporter(quiet_flag: str) -> Callable[..., None]:
+    """
+    Build a print() replacement that an environment switch can silence.
+
+    Args:
+        quiet_flag: Environment variable that, when set (see env_flag),
+            turns the returned function into a no-op
+
+    Returns:
+        Function with the print() signature
+    """
+    if env_flag(quiet_flag):
+        return lambda *args, **kwargs: None
+    return print